@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import queue
 import random
-import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
-_NEXT_LINK_RE = re.compile(r"<([^>]+)>;\s*rel=\"next\"")
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _response_json(response: httpx.Response) -> Any:
+    """Parse a response body, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class CanvasApiError(RuntimeError):
@@ -118,6 +133,32 @@ class CalendarEvent:
     context_name: str | None
 
 
+def _compute_backoff(attempt: int, response: httpx.Response | None = None) -> float:
+    """Exponential backoff honoring Retry-After, with up to 25% jitter."""
+    base_delay = 0.5 * (2**attempt)
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                base_delay = float(retry_after)
+            except ValueError:
+                pass
+    return base_delay + random.random() * 0.25 * base_delay
+
+
+def _course_summary_from_raw(item: dict[str, Any]) -> CourseSummary:
+    term = item.get("term") or {}
+    return CourseSummary(
+        id=int(item["id"]),
+        course_code=item.get("course_code") or "",
+        name=item.get("name") or "",
+        workflow_state=item.get("workflow_state"),
+        term_name=term.get("name"),
+        start_at=item.get("start_at"),
+        end_at=item.get("end_at"),
+    )
+
+
 class CanvasClient:
     def __init__(
         self,
@@ -131,17 +172,40 @@ class CanvasClient:
         self.base_url = normalized
         self.api_root = normalized + "/api/v1"
         self.max_retries = max_retries
+        self._token = token
+        self._timeout = timeout
         self._client = httpx.Client(
             base_url=self.api_root,
             timeout=timeout,
-            headers={"Authorization": f"Bearer {token}"},
+            headers={"Authorization": f"Bearer {token}".encode("ascii")},
             follow_redirects=True,
             verify=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=16,
+                keepalive_expiry=30.0,
+            ),
         )
+        # ETag cache for conditional GETs: normalized target+params -> (etag, payload).
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
 
     def close(self) -> None:
         self._client.close()
 
+    def async_clone(self) -> "AsyncCanvasClient":
+        """Build an AsyncCanvasClient with this client's connection settings.
+
+        Used by bulk-download paths that multiplex many transfers over a few
+        HTTP/2 connections instead of one blocking socket per thread.
+        """
+        return AsyncCanvasClient(
+            self.base_url,
+            self._token,
+            timeout=self._timeout,
+            max_retries=self.max_retries,
+        )
+
     def __enter__(self) -> "CanvasClient":
         return self
 
@@ -149,16 +213,7 @@ class CanvasClient:
         self.close()
 
     def _sleep_for_retry(self, attempt: int, response: httpx.Response | None = None) -> None:
-        base_delay = 0.5 * (2**attempt)
-        if response is not None:
-            retry_after = response.headers.get("retry-after")
-            if retry_after:
-                try:
-                    base_delay = float(retry_after)
-                except ValueError:
-                    pass
-        jitter = random.uniform(0, 0.25 * base_delay)
-        time.sleep(base_delay + jitter)
+        time.sleep(_compute_backoff(attempt, response))
 
     def _request(
         self,
@@ -169,19 +224,45 @@ class CanvasClient:
         data: Any = None,
         json: Any = None,
         files: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        return self._request_normalized(
+            method,
+            self._normalize_request_target(path_or_url),
+            params=params,
+            data=data,
+            json=json,
+            files=files,
+            headers=headers,
+        )
+
+    def _request_normalized(
+        self,
+        method: str,
+        target: str,
+        *,
+        params: dict[str, Any] | None = None,
+        data: Any = None,
+        json: Any = None,
+        files: Any = None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        target = self._normalize_request_target(path_or_url)
         last_error: Exception | None = None
         for attempt in range(self.max_retries + 1):
             try:
-                response = self._client.request(
-                    method,
-                    target,
-                    params=params,
-                    data=data,
-                    json=json,
-                    files=files,
-                )
+                # Bare paginated GETs skip httpx's param/body merge path.
+                if params is None and data is None and json is None and files is None and headers is None:
+                    response = self._client.request(method, target)
+                else:
+                    response = self._client.request(
+                        method,
+                        target,
+                        params=params,
+                        data=data,
+                        json=json,
+                        files=files,
+                        headers=headers,
+                    )
             except httpx.TransportError as exc:
                 last_error = exc
                 if attempt >= self.max_retries:
@@ -196,7 +277,7 @@ class CanvasClient:
                 if attempt >= self.max_retries:
                     raise CanvasApiError(
                         f"Canvas request failed after retries ({response.status_code})",
-                        detail=response.text[:200].strip(),
+                        detail=response.content[:200].decode("utf-8", errors="replace").strip(),
                     )
                 self._sleep_for_retry(attempt, response)
                 continue
@@ -204,7 +285,7 @@ class CanvasClient:
             if response.status_code >= 400:
                 raise CanvasApiError(
                     f"Canvas request failed ({response.status_code}) for {target}",
-                    detail=response.text[:200].strip(),
+                    detail=response.content[:200].decode("utf-8", errors="replace").strip(),
                 )
 
             return response
@@ -224,18 +305,51 @@ class CanvasClient:
         self,
         url: str,
         destination: Path,
-    ) -> tuple[int, str, str | None]:
+        *,
+        compute_hash: bool = True,
+        if_none_match: str | None = None,
+    ) -> tuple[int, str, str | None] | None:
         destination.parent.mkdir(parents=True, exist_ok=True)
         temp_path = destination.with_name(destination.name + ".part")
+        # A partial file left by an earlier run may belong to a different file
+        # version; only resume partials written during this call.
+        temp_path.unlink(missing_ok=True)
+        resume_validator: str | None = None
 
         for attempt in range(self.max_retries + 1):
+            resume_from = temp_path.stat().st_size if attempt > 0 and temp_path.exists() else 0
+            if resume_from and resume_validator is None:
+                # Without a validator a ranged resume could splice bytes from
+                # two entity versions into one "valid" hash; restart instead.
+                temp_path.unlink(missing_ok=True)
+                resume_from = 0
+            if resume_from:
+                # If-Range makes the resume conditional: the server only
+                # honors the Range when the entity is unchanged, and replies
+                # with a full 200 body otherwise.
+                request_headers: dict[str, str] | None = {
+                    "Range": f"bytes={resume_from}-",
+                    "If-Range": resume_validator,
+                }
+            elif if_none_match:
+                # Conditional GET: a 304 costs one header exchange instead of
+                # re-streaming a file we already hold on disk.
+                request_headers = {"If-None-Match": if_none_match}
+            else:
+                request_headers = None
             try:
-                with self._client.stream("GET", url) as response:
+                with self._client.stream("GET", url, headers=request_headers) as response:
                     if response.status_code == 401:
+                        temp_path.unlink(missing_ok=True)
                         raise CanvasUnauthorizedError("Canvas API rejected the token (401).")
 
+                    if response.status_code == 304 and if_none_match:
+                        temp_path.unlink(missing_ok=True)
+                        return None
+
                     if response.status_code in RETRYABLE_STATUS_CODES:
                         if attempt >= self.max_retries:
+                            temp_path.unlink(missing_ok=True)
                             raise CanvasApiError(
                                 f"Download failed after retries ({response.status_code}) for {url}"
                             )
@@ -243,33 +357,76 @@ class CanvasClient:
                         continue
 
                     if response.status_code >= 400:
-                        snippet = response.text[:200].strip()
+                        body = response.read()
+                        snippet = body[:200].decode("utf-8", errors="replace").strip()
+                        temp_path.unlink(missing_ok=True)
                         raise CanvasApiError(
                             f"Download failed ({response.status_code}) for {url}: {snippet}"
                         )
 
-                    file_hash = hashlib.sha256()
-                    bytes_written = 0
-                    with temp_path.open("wb") as handle:
-                        for chunk in response.iter_bytes():
-                            if not chunk:
-                                continue
-                            handle.write(chunk)
-                            file_hash.update(chunk)
-                            bytes_written += len(chunk)
+                    # Remember the entity validator before streaming so a
+                    # retry after a mid-stream failure can resume with
+                    # If-Range instead of blindly appending.
+                    resume_validator = response.headers.get("etag") or response.headers.get(
+                        "last-modified"
+                    )
+
+                    # The server ignored the Range request (or If-Range saw a
+                    # changed entity) and replied with the full body; restart
+                    # the partial file from scratch.
+                    if resume_from and response.status_code != 206:
+                        resume_from = 0
+
+                    mode = "ab" if resume_from else "wb"
+                    if compute_hash:
+                        # Hash in a worker thread so disk writes and SHA-256
+                        # overlap instead of running serially per chunk.
+                        file_hash = hashlib.sha256()
+                        if resume_from:
+                            with temp_path.open("rb") as existing:
+                                while prefix := existing.read(_DOWNLOAD_CHUNK_SIZE):
+                                    file_hash.update(prefix)
+                        hash_queue: queue.Queue[bytes | None] = queue.Queue(maxsize=4)
+
+                        def hash_worker() -> None:
+                            while True:
+                                pending = hash_queue.get()
+                                if pending is None:
+                                    return
+                                file_hash.update(pending)
+
+                        hasher = threading.Thread(target=hash_worker, daemon=True)
+                        hasher.start()
+                        try:
+                            with temp_path.open(mode, buffering=_DOWNLOAD_CHUNK_SIZE) as handle:
+                                for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                                    if not chunk:
+                                        continue
+                                    hash_queue.put(chunk)
+                                    handle.write(chunk)
+                        finally:
+                            hash_queue.put(None)
+                            hasher.join()
+                        digest = file_hash.hexdigest()
+                        bytes_written = temp_path.stat().st_size
+                    else:
+                        with temp_path.open(mode, buffering=_DOWNLOAD_CHUNK_SIZE) as handle:
+                            for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                                handle.write(chunk)
+                            bytes_written = handle.tell()
+                        digest = ""
 
                     temp_path.replace(destination)
                     etag = response.headers.get("etag")
-                    return bytes_written, file_hash.hexdigest(), etag
+                    return bytes_written, digest, etag
 
             except httpx.TransportError as exc:
                 if attempt >= self.max_retries:
+                    temp_path.unlink(missing_ok=True)
                     raise CanvasApiError(f"Download network failure for {url}: {exc}") from exc
                 self._sleep_for_retry(attempt)
-            finally:
-                if temp_path.exists():
-                    temp_path.unlink(missing_ok=True)
 
+        temp_path.unlink(missing_ok=True)
         raise CanvasApiError(f"Download failed for {url}")
 
     def get_json(
@@ -278,8 +435,18 @@ class CanvasClient:
         *,
         params: dict[str, Any] | None = None,
     ) -> Any:
-        response = self._request("GET", path_or_url, params=params)
-        return response.json()
+        target = self._normalize_request_target(path_or_url)
+        cache_key = f"{target}?{params!r}"
+        cached = self._etag_cache.get(cache_key)
+        request_headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._request_normalized("GET", target, params=params, headers=request_headers)
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+        payload = _response_json(response)
+        etag = response.headers.get("etag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, payload)
+        return payload
 
     def post_json(
         self,
@@ -340,16 +507,14 @@ class CanvasClient:
                 )
             seen_targets.add(current_target)
 
-            response = self._request("GET", next_url, params=next_params)
-            payload = response.json()
+            response = self._request_normalized("GET", current_target, params=next_params)
+            payload = _response_json(response)
             if isinstance(payload, list):
                 results.extend(payload)
             else:
                 results.append(payload)
 
-            link_header = response.headers.get("link", "")
-            match = _NEXT_LINK_RE.search(link_header)
-            next_url = match.group(1) if match else None
+            next_url = response.links.get("next", {}).get("url")
             next_params = None
 
         return results
@@ -363,21 +528,7 @@ class CanvasClient:
             params["enrollment_state"] = "active"
 
         raw_courses = self.get_paginated("/courses", params=params)
-        courses: list[CourseSummary] = []
-        for item in raw_courses:
-            term = item.get("term") or {}
-            courses.append(
-                CourseSummary(
-                    id=int(item["id"]),
-                    course_code=item.get("course_code") or "",
-                    name=item.get("name") or "",
-                    workflow_state=item.get("workflow_state"),
-                    term_name=term.get("name"),
-                    start_at=item.get("start_at"),
-                    end_at=item.get("end_at"),
-                )
-            )
-        return courses
+        return [_course_summary_from_raw(item) for item in raw_courses]
 
     def list_courses_with_grades(self, *, include_all: bool = False) -> list[CourseGrade]:
         params: dict[str, Any] = {
@@ -466,14 +617,20 @@ class CanvasClient:
 
     def list_pages(self, course_id: int) -> list[dict[str, Any]]:
         pages = self.get_paginated(f"/courses/{course_id}/pages", params={"per_page": 100})
-        detailed_pages: list[dict[str, Any]] = []
-        for page in pages:
-            page_url = page.get("url")
-            if not page_url:
-                continue
-            detail = self.get_json(f"/courses/{course_id}/pages/{page_url}")
-            detailed_pages.append(detail)
-        return detailed_pages
+        page_urls = [page.get("url") for page in pages]
+        page_urls = [page_url for page_url in page_urls if page_url]
+        if not page_urls:
+            return []
+
+        # Page bodies require one detail GET each; httpx.Client is thread-safe,
+        # so fetch them concurrently (bounded to stay under Canvas rate limits)
+        # while ex.map preserves page order.
+        def fetch_detail(page_url: str) -> dict[str, Any]:
+            return self.get_json(f"/courses/{course_id}/pages/{page_url}")
+
+        max_workers = min(8, len(page_urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch_detail, page_urls))
 
     def list_modules(self, course_id: int) -> list[dict[str, Any]]:
         return self.get_paginated(
@@ -564,8 +721,22 @@ class CanvasClient:
             raise CanvasApiError(f"Unexpected file payload for file_id={file_id}")
         return payload
 
-    def download_file(self, url: str, destination: Path) -> tuple[int, str, str | None]:
-        return self._stream_download_to_file(url, destination)
+    def download_file(
+        self,
+        url: str,
+        destination: Path,
+        *,
+        compute_hash: bool = True,
+        if_none_match: str | None = None,
+    ) -> tuple[int, str, str | None] | None:
+        """Download ``url`` to ``destination``.
+
+        Returns ``(bytes, sha256, etag)``, or ``None`` when ``if_none_match``
+        was supplied and the server answered 304 Not Modified.
+        """
+        return self._stream_download_to_file(
+            url, destination, compute_hash=compute_hash, if_none_match=if_none_match
+        )
 
     def list_upcoming_assignments(self, course_id: int) -> list[UpcomingAssignment]:
         course_data = self.get_json(f"/courses/{course_id}")
@@ -673,12 +844,322 @@ class CanvasClient:
         )
 
 
+class AsyncCanvasClient:
+    """Async variant of :class:`CanvasClient` for latency-bound bulk reads.
+
+    Pagination still walks ``next`` links serially (each page's URL comes from
+    the previous response), but independent requests — page-detail fetches,
+    listings across many courses — can be fanned out with ``asyncio.gather``
+    instead of paying one round trip at a time.
+    """
+
+    _DETAIL_FETCH_LIMIT = 8
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        *,
+        timeout: float = 30.0,
+        max_retries: int = 5,
+    ) -> None:
+        normalized = base_url.rstrip("/")
+        self.base_url = normalized
+        self.api_root = normalized + "/api/v1"
+        self.max_retries = max_retries
+        self._client = httpx.AsyncClient(
+            base_url=self.api_root,
+            timeout=timeout,
+            headers={"Authorization": f"Bearer {token}".encode("ascii")},
+            follow_redirects=True,
+            verify=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncCanvasClient":
+        return self
+
+    async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
+        await self.aclose()
+
+    async def _asleep_for_retry(self, attempt: int, response: httpx.Response | None = None) -> None:
+        await asyncio.sleep(_compute_backoff(attempt, response))
+
+    def _normalize_request_target(self, path_or_url: str) -> str:
+        if path_or_url.startswith(("http://", "https://")):
+            return path_or_url
+        if path_or_url.startswith("/api/v1/"):
+            return path_or_url[len("/api/v1/") :]
+        return path_or_url.lstrip("/")
+
+    async def _request(
+        self,
+        method: str,
+        path_or_url: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        return await self._request_normalized(
+            method,
+            self._normalize_request_target(path_or_url),
+            params=params,
+        )
+
+    async def _request_normalized(
+        self,
+        method: str,
+        target: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        last_error: Exception | None = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                if params is None:
+                    response = await self._client.request(method, target)
+                else:
+                    response = await self._client.request(method, target, params=params)
+            except httpx.TransportError as exc:
+                last_error = exc
+                if attempt >= self.max_retries:
+                    raise CanvasApiError(f"Network failure: {exc}") from exc
+                await self._asleep_for_retry(attempt)
+                continue
+
+            if response.status_code == 401:
+                raise CanvasUnauthorizedError("Canvas API rejected the token (401).")
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                if attempt >= self.max_retries:
+                    raise CanvasApiError(
+                        f"Canvas request failed after retries ({response.status_code})",
+                        detail=response.content[:200].decode("utf-8", errors="replace").strip(),
+                    )
+                await self._asleep_for_retry(attempt, response)
+                continue
+
+            if response.status_code >= 400:
+                raise CanvasApiError(
+                    f"Canvas request failed ({response.status_code}) for {target}",
+                    detail=response.content[:200].decode("utf-8", errors="replace").strip(),
+                )
+
+            return response
+
+        if last_error is not None:
+            raise CanvasApiError(str(last_error)) from last_error
+        raise CanvasApiError("Request failed with unknown error.")
+
+    async def get_json(
+        self,
+        path_or_url: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        response = await self._request("GET", path_or_url, params=params)
+        return _response_json(response)
+
+    async def get_paginated(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> list[Any]:
+        results: list[Any] = []
+        next_url: str | None = path
+        next_params = dict(params or {})
+        seen_targets: set[str] = set()
+
+        while next_url:
+            current_target = self._normalize_request_target(next_url)
+            if current_target in seen_targets:
+                raise CanvasApiError(
+                    f"Pagination loop detected for {path}: repeated next link {next_url!r}"
+                )
+            seen_targets.add(current_target)
+
+            response = await self._request_normalized("GET", current_target, params=next_params)
+            payload = _response_json(response)
+            if isinstance(payload, list):
+                results.extend(payload)
+            else:
+                results.append(payload)
+
+            next_url = response.links.get("next", {}).get("url")
+            next_params = None
+
+        return results
+
+    async def list_courses(self, *, include_all: bool = False) -> list[CourseSummary]:
+        params: dict[str, Any] = {
+            "per_page": 100,
+            "include[]": ["term", "total_students"],
+        }
+        if not include_all:
+            params["enrollment_state"] = "active"
+
+        raw_courses = await self.get_paginated("/courses", params=params)
+        return [_course_summary_from_raw(item) for item in raw_courses]
+
+    async def list_course_files(self, course_id: int) -> list[dict[str, Any]]:
+        return await self.get_paginated(f"/courses/{course_id}/files", params={"per_page": 100})
+
+    async def list_course_folders(self, course_id: int) -> dict[int, str]:
+        folder_map: dict[int, str] = {}
+        folders = await self.get_paginated(
+            f"/courses/{course_id}/folders", params={"per_page": 100}
+        )
+        for folder in folders:
+            folder_id = folder.get("id")
+            if folder_id is None:
+                continue
+            full_name = folder.get("full_name") or folder.get("name") or ""
+            folder_map[int(folder_id)] = str(full_name).strip("/")
+        return folder_map
+
+    async def list_assignments(self, course_id: int) -> list[dict[str, Any]]:
+        return await self.get_paginated(
+            f"/courses/{course_id}/assignments",
+            params={"per_page": 100},
+        )
+
+    async def list_discussions(self, course_id: int) -> list[dict[str, Any]]:
+        return await self.get_paginated(
+            f"/courses/{course_id}/discussion_topics",
+            params={"per_page": 100},
+        )
+
+    async def list_pages(self, course_id: int) -> list[dict[str, Any]]:
+        pages = await self.get_paginated(f"/courses/{course_id}/pages", params={"per_page": 100})
+        semaphore = asyncio.Semaphore(self._DETAIL_FETCH_LIMIT)
+
+        async def fetch_detail(page_url: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get_json(f"/courses/{course_id}/pages/{page_url}")
+
+        page_urls = [page.get("url") for page in pages]
+        return list(
+            await asyncio.gather(
+                *(fetch_detail(page_url) for page_url in page_urls if page_url)
+            )
+        )
+
+    async def list_modules(self, course_id: int) -> list[dict[str, Any]]:
+        return await self.get_paginated(
+            f"/courses/{course_id}/modules",
+            params={"per_page": 100, "include[]": ["items"]},
+        )
+
+    async def download_file(
+        self,
+        url: str,
+        destination: Path,
+        *,
+        compute_hash: bool = True,
+        if_none_match: str | None = None,
+    ) -> tuple[int, str, str | None] | None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = destination.with_name(destination.name + ".part")
+        # A partial file left by an earlier run may belong to a different file
+        # version; only resume partials written during this call.
+        temp_path.unlink(missing_ok=True)
+        resume_validator: str | None = None
+
+        for attempt in range(self.max_retries + 1):
+            resume_from = temp_path.stat().st_size if attempt > 0 and temp_path.exists() else 0
+            if resume_from and resume_validator is None:
+                # Without a validator a ranged resume could splice bytes from
+                # two entity versions into one "valid" hash; restart instead.
+                temp_path.unlink(missing_ok=True)
+                resume_from = 0
+            if resume_from:
+                # If-Range makes the resume conditional: the server only
+                # honors the Range when the entity is unchanged, and replies
+                # with a full 200 body otherwise.
+                request_headers: dict[str, str] | None = {
+                    "Range": f"bytes={resume_from}-",
+                    "If-Range": resume_validator,
+                }
+            elif if_none_match:
+                request_headers = {"If-None-Match": if_none_match}
+            else:
+                request_headers = None
+            try:
+                async with self._client.stream("GET", url, headers=request_headers) as response:
+                    if response.status_code == 401:
+                        temp_path.unlink(missing_ok=True)
+                        raise CanvasUnauthorizedError("Canvas API rejected the token (401).")
+
+                    if response.status_code == 304 and if_none_match:
+                        temp_path.unlink(missing_ok=True)
+                        return None
+
+                    if response.status_code in RETRYABLE_STATUS_CODES:
+                        if attempt >= self.max_retries:
+                            temp_path.unlink(missing_ok=True)
+                            raise CanvasApiError(
+                                f"Download failed after retries ({response.status_code}) for {url}"
+                            )
+                        await self._asleep_for_retry(attempt, response)
+                        continue
+
+                    if response.status_code >= 400:
+                        body = await response.aread()
+                        snippet = body[:200].decode("utf-8", errors="replace").strip()
+                        temp_path.unlink(missing_ok=True)
+                        raise CanvasApiError(
+                            f"Download failed ({response.status_code}) for {url}: {snippet}"
+                        )
+
+                    # Remember the entity validator before streaming so a
+                    # retry after a mid-stream failure can resume with
+                    # If-Range instead of blindly appending.
+                    resume_validator = response.headers.get("etag") or response.headers.get(
+                        "last-modified"
+                    )
+
+                    # The server ignored the Range request (or If-Range saw a
+                    # changed entity) and replied with the full body; restart
+                    # the partial file from scratch.
+                    if resume_from and response.status_code != 206:
+                        resume_from = 0
+
+                    mode = "ab" if resume_from else "wb"
+                    file_hash = hashlib.sha256() if compute_hash else None
+                    if file_hash is not None and resume_from:
+                        with temp_path.open("rb") as existing:
+                            while prefix := existing.read(_DOWNLOAD_CHUNK_SIZE):
+                                file_hash.update(prefix)
+                    with temp_path.open(mode, buffering=_DOWNLOAD_CHUNK_SIZE) as handle:
+                        async for chunk in response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            if file_hash is not None:
+                                file_hash.update(chunk)
+                            handle.write(chunk)
+                        bytes_written = handle.tell()
+                    digest = file_hash.hexdigest() if file_hash is not None else ""
+
+                    temp_path.replace(destination)
+                    etag = response.headers.get("etag")
+                    return bytes_written, digest, etag
+
+            except httpx.TransportError as exc:
+                if attempt >= self.max_retries:
+                    temp_path.unlink(missing_ok=True)
+                    raise CanvasApiError(f"Download network failure for {url}: {exc}") from exc
+                await self._asleep_for_retry(attempt)
+
+        temp_path.unlink(missing_ok=True)
+        raise CanvasApiError(f"Download failed for {url}")
+
+
 def dedupe_courses(courses: Iterable[CourseSummary]) -> list[CourseSummary]:
-    seen: set[int] = set()
-    out: list[CourseSummary] = []
+    # Dicts preserve insertion order; setdefault keeps the first occurrence
+    # of each id, matching the previous seen-set behavior.
+    by_id: dict[int, CourseSummary] = {}
     for course in courses:
-        if course.id in seen:
-            continue
-        seen.add(course.id)
-        out.append(course)
-    return out
+        by_id.setdefault(course.id, course)
+    return list(by_id.values())
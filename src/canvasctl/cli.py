@@ -1,22 +1,25 @@
 from __future__ import annotations
 
 import json
-from datetime import UTC, datetime
-from enum import Enum
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Callable, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple, Protocol, Sequence, TypeVar
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 from canvasctl.auth import AuthError, TokenInfo, prompt_for_token, resolve_token
-from canvasctl.canvas_api import (
-    CanvasApiError,
-    CanvasClient,
-    CanvasUnauthorizedError,
-    CourseSummary,
-)
 from canvasctl.config import (
     DEFAULT_CONCURRENCY,
     AppConfig,
@@ -29,39 +32,14 @@ from canvasctl.config import (
     set_course_path,
     set_default_destination,
 )
-from canvasctl.courses import course_to_dict, render_courses_table, sort_courses
-from canvasctl.downloader import (
-    build_course_slug,
-    download_tasks,
-    plan_course_download_tasks,
-    result_to_manifest_item,
-    summarize_results,
-)
-from canvasctl.grades import (
-    _default_export_dir,
-    assignment_grade_to_dict,
-    export_grades_csv,
-    export_grades_json,
-    grade_to_dict,
-    render_detailed_grades_table,
-    render_grades_summary_table,
-    sort_assignment_grades,
-    sort_grades,
-)
-from canvasctl.interactive import prompt_interactive_selection
-from canvasctl.manifest import (
-    course_manifest_path,
-    index_items_by_file_id,
-    load_manifest,
-    write_course_manifest,
-    write_manifest,
-)
-from canvasctl.sources import (
-    ALL_SOURCES,
-    collect_remote_files_for_course,
-    normalize_sources,
-    warning_to_manifest_item,
-)
+
+# canvas_api (and everything that imports it) pulls in httpx, which dominates
+# cold-start time. Commands that talk to Canvas import what they need at call
+# time — the same pattern `mcp serve` and `onboard` already use — so config
+# commands and --help never pay for it.
+if TYPE_CHECKING:
+    from canvasctl.canvas_api import CanvasClient, CourseSummary, RemoteFile
+    from canvasctl.sources import SourceWarning
 
 app = typer.Typer(help="Canvas LMS CLI")
 config_app = typer.Typer(help="Manage local cvsctl config")
@@ -82,7 +60,7 @@ app.add_typer(mcp_app, name="mcp")
 console = Console()
 
 
-class SourceChoice(str, Enum):
+class SourceChoice(StrEnum):
     files = "files"
     assignments = "assignments"
     discussions = "discussions"
@@ -91,7 +69,20 @@ class SourceChoice(str, Enum):
 
 
 def _iso_now() -> str:
-    return datetime.now(UTC).isoformat()
+    # Second precision is plenty for manifest bookkeeping; C-level strftime
+    # over gmtime skips constructing a datetime object entirely.
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+
+def _emit_json(payload: Any) -> None:
+    """Write JSON straight to stdout, bypassing Rich's markup scanning."""
+    if orjson is not None:
+        sys.stdout.buffer.write(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(json.dumps(payload, indent=2) + "\n")
 
 
 def _fail(message: str, *, code: int = 1) -> None:
@@ -109,7 +100,7 @@ def _load_config_or_fail() -> AppConfig:
 
 def _resolve_base_url_or_fail(cfg: AppConfig, override: str | None) -> str:
     try:
-        return resolve_base_url(override, cfg)
+        return _resolve_base_url_cached(override, cfg.base_url)
     except ConfigError as exc:
         _fail(str(exc))
     raise AssertionError("unreachable")
@@ -127,6 +118,8 @@ def _run_with_client(
     base_url: str,
     action: Callable[[CanvasClient], int | None],
 ) -> int | None:
+    from canvasctl.canvas_api import CanvasApiError, CanvasClient, CanvasUnauthorizedError
+
     token_info = _resolve_token_or_fail()
 
     while True:
@@ -147,10 +140,24 @@ def _run_with_client(
             _fail(str(exc))
 
 
-def _resolve_destination(dest: Path | None, cfg: AppConfig) -> Path:
+@lru_cache(maxsize=8)
+def _resolve_base_url_cached(override: str | None, configured: str | None) -> str:
+    return resolve_base_url(override, AppConfig(base_url=configured))
+
+
+@lru_cache(maxsize=8)
+def _resolve_destination_cached(dest: str | None, default_dest: str | None) -> Path:
     if dest is not None:
-        return dest.expanduser().resolve()
-    return cfg.destination_path().resolve()
+        return Path(dest).expanduser().resolve()
+    if default_dest:
+        return Path(default_dest).expanduser().resolve()
+    return (Path.home() / "Downloads").resolve()
+
+
+def _resolve_destination(dest: Path | None, cfg: AppConfig) -> Path:
+    # Path.resolve() stats every path component; commands consult the
+    # destination repeatedly per run, so memoize on the raw inputs.
+    return _resolve_destination_cached(str(dest) if dest is not None else None, cfg.default_dest)
 
 
 def _resolve_concurrency(value: int | None, cfg: AppConfig) -> int:
@@ -161,17 +168,21 @@ def _resolve_concurrency(value: int | None, cfg: AppConfig) -> int:
     return cfg.default_concurrency if cfg.default_concurrency > 0 else DEFAULT_CONCURRENCY
 
 
+_BOOL_TEXT = {
+    "true": True, "1": True, "yes": True, "y": True, "on": True,
+    "false": False, "0": False, "no": False, "n": False, "off": False,
+}
+
+
 def _parse_bool_text(value: str, *, option_name: str) -> bool:
-    normalized = value.strip().lower()
-    if normalized in {"true", "1", "yes", "y", "on"}:
-        return True
-    if normalized in {"false", "0", "no", "n", "off"}:
-        return False
-    _fail(
-        f"{option_name} must be one of: true/false, 1/0, yes/no, on/off. "
-        f"Received: {value!r}"
-    )
-    raise AssertionError("unreachable")
+    result = _BOOL_TEXT.get(value.strip().lower())
+    if result is None:
+        _fail(
+            f"{option_name} must be one of: true/false, 1/0, yes/no, on/off. "
+            f"Received: {value!r}"
+        )
+        raise AssertionError("unreachable")
+    return result
 
 
 def _resolve_overwrite(overwrite: str | None, force: bool) -> bool:
@@ -200,27 +211,49 @@ def _persist_destination_if_requested(
     console.print(f"[green]Saved default download path:[/green] {cfg.default_dest}")
 
 
+class _CourseLike(Protocol):
+    id: int
+    course_code: str
+
+
+_CourseT = TypeVar("_CourseT", bound=_CourseLike)
+
+
+class _SelectorCourse(NamedTuple):
+    """Lightweight stand-in for CourseSummary when only selector fields matter."""
+
+    id: int
+    course_code: str
+
+
+def _norm_code(value: str) -> str:
+    # casefold matches lower() for ASCII codes, handles non-ASCII ones
+    # correctly, and returns the same object when nothing changes.
+    return value.strip().casefold()
+
+
 def _resolve_courses_from_selectors(
-    courses: Sequence[CourseSummary],
+    courses: Sequence[_CourseT],
     selectors: Sequence[str],
-) -> list[CourseSummary]:
-    by_id = {str(course.id): course for course in courses}
-    by_code: dict[str, list[CourseSummary]] = {}
+) -> list[_CourseT]:
+    by_id = {course.id: course for course in courses}
+    by_code: dict[str, list[_CourseT]] = {}
+    add_code = by_code.setdefault
     for course in courses:
-        code = course.course_code.strip().lower()
+        code = _norm_code(course.course_code)
         if not code:
             continue
-        by_code.setdefault(code, []).append(course)
+        add_code(code, []).append(course)
 
-    selected: list[CourseSummary] = []
-    seen_ids: set[int] = set()
+    resolved: dict[int, _CourseT] = {}
 
     for selector in selectors:
         selector_stripped = selector.strip()
-        if selector_stripped in by_id:
-            course = by_id[selector_stripped]
-        else:
-            matches = by_code.get(selector_stripped.lower(), [])
+        # isdecimal, not isdigit: isdigit accepts characters like superscripts
+        # that int() rejects, while every isdecimal string parses cleanly.
+        course = by_id.get(int(selector_stripped)) if selector_stripped.isdecimal() else None
+        if course is None:
+            matches = by_code.get(selector_stripped.casefold(), [])
             if not matches:
                 _fail(
                     f"Course selector {selector!r} did not match any course id/course_code."
@@ -233,11 +266,9 @@ def _resolve_courses_from_selectors(
                 )
             course = matches[0]
 
-        if course.id not in seen_ids:
-            seen_ids.add(course.id)
-            selected.append(course)
+        resolved.setdefault(course.id, course)
 
-    return selected
+    return list(resolved.values())
 
 
 def _resolve_assignment_from_selector(
@@ -245,7 +276,7 @@ def _resolve_assignment_from_selector(
     selector: str,
 ) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
     stripped = selector.strip()
-    if stripped.isdigit():
+    if stripped.isdecimal():
         assignment_id = int(stripped)
         for assignment in assignments:
             if assignment.get("id") == assignment_id:
@@ -298,24 +329,30 @@ def _download_for_courses(
     concurrency: int,
     base_url: str,
     course_paths: dict[str, str] | None = None,
+    precomputed_remote_files: dict[int, tuple[list[RemoteFile], list[SourceWarning]]] | None = None,
 ) -> int:
-    started_at = _iso_now()
+    from canvasctl.downloader import (
+        build_course_slug,
+        download_tasks,
+        plan_course_download_tasks,
+        result_to_manifest_item,
+        summarize_results,
+    )
+    from canvasctl.manifest import (
+        course_manifest_path,
+        index_items_by_file_id,
+        load_manifest,
+        write_course_manifest,
+        write_manifest,
+    )
+    from canvasctl.sources import collect_remote_files_for_course, warning_to_manifest_item
 
-    summary_table = Table(title="Download Summary")
-    summary_table.add_column("Course")
-    summary_table.add_column("Downloaded", justify="right")
-    summary_table.add_column("Skipped", justify="right")
-    summary_table.add_column("Failed", justify="right")
-    summary_table.add_column("Unresolved", justify="right")
+    started_at = _iso_now()
 
+    summary_rows: list[tuple[str, str, str, str, str]] = []
     had_failures = False
 
-    for course in selected_courses:
-        remote_files, warnings = collect_remote_files_for_course(client, course.id, sources)
-
-        if not remote_files and not warnings:
-            console.print(f"[yellow]No files found for course {course.id} ({course.name}).[/yellow]")
-
+    def load_previous(course: CourseSummary) -> tuple[str, Path | None, Path, dict[int, dict[str, Any]]]:
         course_slug = build_course_slug(course)
         custom_dest: Path | None = None
         if course_paths and str(course.id) in course_paths:
@@ -326,8 +363,29 @@ def _download_for_courses(
         else:
             manifest_file = course_manifest_path(dest_root, course_slug)
 
-        existing_manifest = load_manifest(manifest_file)
-        previous_by_file_id = index_items_by_file_id(existing_manifest)
+        return course_slug, custom_dest, manifest_file, index_items_by_file_id(load_manifest(manifest_file))
+
+    # Read and index existing manifests up front with a small pool so the
+    # disk I/O and JSON parsing overlap the first course's API calls instead
+    # of sitting on the critical path between courses.
+    with ThreadPoolExecutor(max_workers=min(4, len(selected_courses) or 1)) as executor:
+        previous_state = dict(
+            zip(
+                (course.id for course in selected_courses),
+                executor.map(load_previous, selected_courses),
+            )
+        )
+
+    for course in selected_courses:
+        if precomputed_remote_files is not None and course.id in precomputed_remote_files:
+            remote_files, warnings = precomputed_remote_files[course.id]
+        else:
+            remote_files, warnings = collect_remote_files_for_course(client, course.id, sources)
+
+        if not remote_files and not warnings:
+            console.print(f"[yellow]No files found for course {course.id} ({course.name}).[/yellow]")
+
+        course_slug, custom_dest, manifest_file, previous_by_file_id = previous_state[course.id]
 
         tasks = plan_course_download_tasks(
             course, remote_files, dest_root=dest_root, course_dest=custom_dest,
@@ -341,16 +399,23 @@ def _download_for_courses(
             console=console,
         )
 
-        manifest_items = []
-        for result in results:
-            if result.status == "skipped":
-                prev = previous_by_file_id.get(result.task.file.file_id)
-                if prev is not None:
-                    manifest_items.append(prev)
-                    continue
-            manifest_items.append(result_to_manifest_item(result))
-        manifest_items.extend(
-            warning_to_manifest_item(warning, course_id=course.id) for warning in warnings
+        def iter_result_items() -> Iterator[dict[str, Any]]:
+            for result in results:
+                if result.status == "skipped":
+                    prev = previous_by_file_id.get(result.task.file.file_id)
+                    if prev is not None:
+                        yield prev
+                        continue
+                yield result_to_manifest_item(result)
+
+        # Produce items lazily and materialize exactly once at the payload
+        # boundary; json/orjson encoders do not accept iterators, so this is
+        # as close to streaming as the manifest writer allows.
+        manifest_items = list(
+            chain(
+                iter_result_items(),
+                (warning_to_manifest_item(warning, course_id=course.id) for warning in warnings),
+            )
         )
 
         completed_at = _iso_now()
@@ -373,15 +438,32 @@ def _download_for_courses(
         if counts["failed"] > 0:
             had_failures = True
 
-        summary_table.add_row(
-            f"{course.course_code or course.id} ({course.id})",
-            str(counts["downloaded"]),
-            str(counts["skipped"]),
-            str(counts["failed"]),
-            str(unresolved_count),
+        summary_rows.append(
+            (
+                f"{course.course_code or course.id} ({course.id})",
+                str(counts["downloaded"]),
+                str(counts["skipped"]),
+                str(counts["failed"]),
+                str(unresolved_count),
+            )
         )
 
-    console.print(summary_table)
+    if console.is_terminal:
+        summary_table = Table(title="Download Summary")
+        summary_table.add_column("Course")
+        summary_table.add_column("Downloaded", justify="right")
+        summary_table.add_column("Skipped", justify="right")
+        summary_table.add_column("Failed", justify="right")
+        summary_table.add_column("Unresolved", justify="right")
+        for row in summary_rows:
+            summary_table.add_row(*row)
+        console.print(summary_table)
+    else:
+        # Piped/scripted output: skip Rich's layout pass and emit
+        # tab-separated rows instead.
+        sys.stdout.write("course\tdownloaded\tskipped\tfailed\tunresolved\n")
+        for row in summary_rows:
+            sys.stdout.write("\t".join(row) + "\n")
 
     return 1 if had_failures else 0
 
@@ -473,6 +555,13 @@ def courses_list(
     base_url: str | None = typer.Option(None, "--base-url", help="Canvas instance URL override."),
 ) -> None:
     """List courses from Canvas."""
+    from canvasctl.courses import (
+        course_to_dict,
+        render_courses_plain,
+        render_courses_table,
+        sort_courses,
+    )
+
     cfg = _load_config_or_fail()
     resolved_base_url = _resolve_base_url_or_fail(cfg, base_url)
 
@@ -480,9 +569,13 @@ def courses_list(
         courses = sort_courses(client.list_courses(include_all=all_courses))
         if json_output:
             payload = [course_to_dict(course) for course in courses]
-            console.print(json.dumps(payload, indent=2))
-        else:
+            _emit_json(payload)
+        elif console.is_terminal:
             console.print(render_courses_table(courses))
+        else:
+            # Piped/scripted output: emit tab-separated rows instead of a
+            # styled table.
+            sys.stdout.write(render_courses_plain(courses))
         return 0
 
     _run_with_client(resolved_base_url, action)
@@ -506,6 +599,17 @@ def grades_summary(
     ),
 ) -> None:
     """Show grade summary for enrolled courses."""
+    from canvasctl.grades import (
+        assignment_grade_to_dict,
+        grade_to_dict,
+        render_detailed_grades_plain,
+        render_detailed_grades_table,
+        render_grades_summary_plain,
+        render_grades_summary_table,
+        sort_assignment_grades,
+        sort_grades,
+    )
+
     cfg = _load_config_or_fail()
     resolved_base_url = _resolve_base_url_or_fail(cfg, base_url)
 
@@ -515,20 +619,11 @@ def grades_summary(
         )
 
         if course_selectors:
-            course_summaries = [
-                CourseSummary(
-                    id=g.course_id,
-                    course_code=g.course_code,
-                    name=g.course_name,
-                    workflow_state=None,
-                    term_name=None,
-                    start_at=None,
-                    end_at=None,
-                )
-                for g in all_grades
+            selector_courses = [
+                _SelectorCourse(g.course_id, g.course_code) for g in all_grades
             ]
             selected = _resolve_courses_from_selectors(
-                course_summaries, course_selectors
+                selector_courses, course_selectors
             )
             selected_ids = {c.id for c in selected}
             all_grades = [g for g in all_grades if g.course_id in selected_ids]
@@ -536,9 +631,11 @@ def grades_summary(
         if not detailed:
             if json_output:
                 payload = [grade_to_dict(g) for g in all_grades]
-                console.print(json.dumps(payload, indent=2))
-            else:
+                _emit_json(payload)
+            elif console.is_terminal:
                 console.print(render_grades_summary_table(all_grades))
+            else:
+                sys.stdout.write(render_grades_summary_plain(all_grades))
         else:
             if json_output:
                 payload = []
@@ -554,23 +651,29 @@ def grades_summary(
                             ],
                         }
                     )
-                console.print(json.dumps(payload, indent=2))
+                _emit_json(payload)
             else:
                 for course_grade in all_grades:
                     assignments = sort_assignment_grades(
                         client.list_assignment_grades(course_grade.course_id)
                     )
-                    console.print(
-                        render_detailed_grades_table(course_grade, assignments)
-                    )
-                    console.print()
+                    if console.is_terminal:
+                        console.print(
+                            render_detailed_grades_table(course_grade, assignments)
+                        )
+                        console.print()
+                    else:
+                        sys.stdout.write(
+                            render_detailed_grades_plain(course_grade, assignments)
+                        )
+                        sys.stdout.write("\n")
 
         return 0
 
     _run_with_client(resolved_base_url, action)
 
 
-class ExportFormat(str, Enum):
+class ExportFormat(StrEnum):
     csv = "csv"
     json = "json"
 
@@ -603,6 +706,14 @@ def grades_export(
     ),
 ) -> None:
     """Export grades to a CSV or JSON file."""
+    from canvasctl.grades import (
+        _default_export_dir,
+        export_grades_csv,
+        export_grades_json,
+        sort_assignment_grades,
+        sort_grades,
+    )
+
     cfg = _load_config_or_fail()
     resolved_base_url = _resolve_base_url_or_fail(cfg, base_url)
     export_dir = dest.expanduser().resolve() if dest is not None else _default_export_dir()
@@ -613,20 +724,11 @@ def grades_export(
         )
 
         if course_selectors:
-            course_summaries = [
-                CourseSummary(
-                    id=g.course_id,
-                    course_code=g.course_code,
-                    name=g.course_name,
-                    workflow_state=None,
-                    term_name=None,
-                    start_at=None,
-                    end_at=None,
-                )
-                for g in all_grades
+            selector_courses = [
+                _SelectorCourse(g.course_id, g.course_code) for g in all_grades
             ]
             selected = _resolve_courses_from_selectors(
-                course_summaries, course_selectors
+                selector_courses, course_selectors
             )
             selected_ids = {c.id for c in selected}
             all_grades = [g for g in all_grades if g.course_id in selected_ids]
@@ -639,8 +741,7 @@ def grades_export(
                     client.list_assignment_grades(course_grade.course_id)
                 )
 
-        extension = fmt.value
-        filename = f"canvasctl-grades.{extension}"
+        filename = f"canvasctl-grades.{fmt}"
         file_path = export_dir / filename
 
         if fmt == ExportFormat.json:
@@ -689,6 +790,8 @@ def assignments_submit(
     ),
 ) -> None:
     """Submit a Canvas assignment."""
+    from canvasctl.courses import sort_courses
+
     cfg = _load_config_or_fail()
     resolved_base_url = _resolve_base_url_or_fail(cfg, base_url)
 
@@ -823,7 +926,7 @@ def assignments_submit(
             "submission": submission,
         }
         if json_output:
-            console.print(json.dumps(payload, indent=2))
+            _emit_json(payload)
         else:
             table = Table(title="Assignment Submission")
             table.add_column("Field", style="cyan")
@@ -853,7 +956,7 @@ def download_run(
         None,
         "--source",
         "-s",
-        help=f"Source type(s): {', '.join(ALL_SOURCES)}. Defaults to all.",
+        help=f"Source type(s): {', '.join(SourceChoice)}. Defaults to all.",
     ),
     dest: Path | None = typer.Option(None, "--dest", help="Destination root directory."),
     export_dest: bool = typer.Option(
@@ -875,6 +978,9 @@ def download_run(
     base_url: str | None = typer.Option(None, "--base-url", help="Canvas instance URL override."),
 ) -> None:
     """Download files for selected courses."""
+    from canvasctl.courses import sort_courses
+    from canvasctl.sources import normalize_sources
+
     cfg = _load_config_or_fail()
     resolved_base_url = _resolve_base_url_or_fail(cfg, base_url)
     destination = _resolve_destination(dest, cfg)
@@ -887,7 +993,7 @@ def download_run(
     resolved_overwrite = _resolve_overwrite(overwrite, force)
 
     try:
-        selected_sources = normalize_sources([item.value for item in (source_values or [])])
+        selected_sources = normalize_sources(source_values or [])
     except ValueError as exc:
         _fail(str(exc))
 
@@ -927,6 +1033,10 @@ def download_interactive(
     force: bool = typer.Option(False, "--force", help="Overwrite existing files."),
 ) -> None:
     """Run guided prompts to select courses/files to download."""
+    from canvasctl.courses import sort_courses
+    from canvasctl.interactive import prompt_interactive_selection
+    from canvasctl.sources import collect_remote_files_for_course
+
     cfg = _load_config_or_fail()
     resolved_base_url = _resolve_base_url_or_fail(cfg, base_url)
     destination = _resolve_destination(dest, cfg)
@@ -956,10 +1066,26 @@ def download_interactive(
         if not selected_courses:
             _fail("No valid courses selected.")
 
+        # Prefetch each course's remote file listing in parallel so interactive
+        # startup waits on the slowest course rather than the sum of all of them.
+        with ThreadPoolExecutor(max_workers=min(resolved_concurrency, len(selected_courses))) as executor:
+            prefetched = dict(
+                zip(
+                    (course.id for course in selected_courses),
+                    executor.map(
+                        lambda course: collect_remote_files_for_course(
+                            client, course.id, selection.sources
+                        ),
+                        selected_courses,
+                    ),
+                )
+            )
+
         return _download_for_courses(
             client=client,
             selected_courses=selected_courses,
             sources=selection.sources,
+            precomputed_remote_files=prefetched,
             dest_root=destination,
             force=force,
             concurrency=resolved_concurrency,
@@ -2,13 +2,11 @@ from __future__ import annotations
 
 import tomllib
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import platformdirs
-import tomli_w
-
 APP_NAME = "canvas-control"
 DEFAULT_CONCURRENCY = 12
 
@@ -27,10 +25,22 @@ class AppConfig:
     def destination_path(self) -> Path:
         if self.default_dest:
             return Path(self.default_dest).expanduser()
-        return Path.home() / "Downloads"
+        return _home_dir() / "Downloads"
+
 
+@cache
+def _home_dir() -> Path:
+    # Path.home() can hit getpwuid/env on every call; it cannot change
+    # mid-process.
+    return Path.home()
 
+
+@cache
 def config_dir() -> Path:
+    # The platform config dir cannot change mid-process; skip platformdirs'
+    # env scanning after the first call.
+    import platformdirs
+
     return Path(platformdirs.user_config_dir(APP_NAME))
 
 
@@ -66,14 +76,36 @@ def normalize_destination_path(path: str | Path) -> str:
         raise ConfigError(f"Invalid download path {path_obj!s}: {exc}") from exc
 
 
+# Parsed-config snapshot keyed on (path, mtime_ns, size). Commands hit
+# load_config() several times per invocation; one TOML parse per process is
+# enough as long as the file on disk has not changed underneath us.
+_raw_cache: tuple[Path, int, int, dict[str, Any]] | None = None
+
+
 def _read_raw_config() -> dict[str, Any]:
+    global _raw_cache
     path = config_path()
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return {}
+    cached = _raw_cache
+    if (
+        cached is not None
+        and cached[0] == path
+        and cached[1] == stat.st_mtime_ns
+        and cached[2] == stat.st_size
+    ):
+        return cached[3]
     try:
-        return tomllib.loads(path.read_text(encoding="utf-8"))
+        # tomllib.load decodes UTF-8 itself; going through read_text would
+        # build an intermediate str just to hand it over.
+        with path.open("rb") as fp:
+            raw = tomllib.load(fp)
     except tomllib.TOMLDecodeError as exc:
         raise ConfigError(f"Could not parse config file at {path}: {exc}") from exc
+    _raw_cache = (path, stat.st_mtime_ns, stat.st_size, raw)
+    return raw
 
 
 def load_config() -> AppConfig:
@@ -116,6 +148,9 @@ def load_config() -> AppConfig:
 
 
 def save_config(config: AppConfig) -> None:
+    import tomli_w
+
+    global _raw_cache
     config_dir().mkdir(parents=True, exist_ok=True)
     payload: dict[str, Any] = {
         "default_concurrency": config.default_concurrency,
@@ -129,6 +164,7 @@ def save_config(config: AppConfig) -> None:
     cfg_file = config_path()
     cfg_file.write_text(tomli_w.dumps(payload), encoding="utf-8")
     cfg_file.chmod(0o600)
+    _raw_cache = None
 
 
 def set_base_url(url: str) -> AppConfig:
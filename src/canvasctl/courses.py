@@ -1,17 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-
-from rich.table import Table
+from dataclasses import fields
+from typing import TYPE_CHECKING
 
 from canvasctl.canvas_api import CourseSummary
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# Resolved once: asdict() re-introspects and deep-copies per call, and course
+# summaries are flat so a plain getattr sweep is all that is needed.
+_COURSE_SUMMARY_FIELDS = tuple(f.name for f in fields(CourseSummary))
+
 
 def course_to_dict(course: CourseSummary) -> dict[str, str | int | None]:
-    return asdict(course)
+    return {name: getattr(course, name) for name in _COURSE_SUMMARY_FIELDS}
 
 
 def render_courses_table(courses: list[CourseSummary]) -> Table:
+    from rich.table import Table
+
     table = Table(title="Canvas Courses")
     table.add_column("ID", style="cyan", justify="right")
     table.add_column("Course Code", style="magenta")
@@ -37,5 +45,25 @@ def render_courses_table(courses: list[CourseSummary]) -> Table:
     return table
 
 
+def render_courses_plain(courses: list[CourseSummary]) -> str:
+    """Tab-separated fallback for piped output; skips Rich's layout pass."""
+    lines = ["id\tcourse_code\tname\tstate\tterm\tstart\tend"]
+    for course in courses:
+        lines.append(
+            "\t".join(
+                (
+                    str(course.id),
+                    (course.course_code or "").strip(),
+                    (course.name or "").strip(),
+                    course.workflow_state or "",
+                    course.term_name or "",
+                    course.start_at or "",
+                    course.end_at or "",
+                )
+            )
+        )
+    return "\n".join(lines) + "\n"
+
+
 def sort_courses(courses: list[CourseSummary]) -> list[CourseSummary]:
     return sorted(courses, key=lambda c: ((c.course_code or "").lower(), c.name.lower(), c.id))
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import re
+import time
+import unicodedata
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-from rich.console import Console
-from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 from canvasctl.canvas_api import CanvasClient, CourseSummary, RemoteFile
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 _INVALID_SEGMENT_RE = re.compile(r"[^A-Za-z0-9._ -]+")
+_DASH_RUN_RE = re.compile(r"-+")
+# translate() with a delete-table of every valid character is a C-level way
+# to ask "does this string contain anything the regex would touch?" — most
+# filenames are already clean, so the sub() usually never runs.
+_VALID_SEGMENT_CHARS = (
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._ -"
+)
+_VALID_DELETE_TABLE = str.maketrans("", "", _VALID_SEGMENT_CHARS)
 
 
 @dataclass(slots=True)
@@ -33,18 +46,25 @@ class DownloadResult:
     etag: str | None
 
 
+# Both helpers are pure string -> string, and a run keeps feeding them the
+# same course codes and folder names; memoizing turns the repeat calls into
+# dict hits.
+@lru_cache(maxsize=4096)
 def slugify(value: str) -> str:
     lowered = value.strip().lower()
-    lowered = _INVALID_SEGMENT_RE.sub("-", lowered)
+    if lowered.translate(_VALID_DELETE_TABLE):
+        lowered = _INVALID_SEGMENT_RE.sub("-", lowered)
     lowered = lowered.replace(" ", "-")
-    lowered = re.sub(r"-+", "-", lowered)
+    lowered = _DASH_RUN_RE.sub("-", lowered)
     lowered = lowered.strip("-._")
     return lowered or "course"
 
 
+@lru_cache(maxsize=4096)
 def sanitize_segment(segment: str) -> str:
     cleaned = segment.replace("\\", "/").strip()
-    cleaned = _INVALID_SEGMENT_RE.sub("_", cleaned)
+    if cleaned.translate(_VALID_DELETE_TABLE):
+        cleaned = _INVALID_SEGMENT_RE.sub("_", cleaned)
     cleaned = cleaned.strip(" .")
     if cleaned in {"", ".", ".."}:
         return "_"
@@ -81,7 +101,7 @@ def _safe_filename(remote_file: RemoteFile) -> str:
 
 def plan_course_download_tasks(
     course: CourseSummary,
-    remote_files: list[RemoteFile],
+    remote_files: Iterable[RemoteFile],
     *,
     dest_root: Path,
     course_dest: Path | None = None,
@@ -89,38 +109,68 @@ def plan_course_download_tasks(
     course_slug = build_course_slug(course)
     course_root = course_dest if course_dest is not None else dest_root / course_slug
 
-    planned: dict[Path, int] = {}
+    # Dedupe on plain strings: hashing a Path re-joins and normalizes its
+    # parts every lookup, while str caches its hash after the first one.
+    # Keys are NFC-normalized and casefolded so names that collide on
+    # case-insensitive or Unicode-normalizing filesystems (APFS, NTFS) get a
+    # suffix instead of silently overwriting each other.
+    planned: dict[str, int] = {}
     tasks: list[DownloadTask] = []
+    # Folder paths repeat across most of a course's files; sanitize and join
+    # each distinct one once instead of per file.
+    folder_prefixes: dict[str, str] = {}
 
     for remote_file in remote_files:
-        folder_path = sanitize_folder_path(remote_file.folder_path)
+        folder_prefix = folder_prefixes.get(remote_file.folder_path)
+        if folder_prefix is None:
+            folder_prefix = str(course_root / sanitize_folder_path(remote_file.folder_path))
+            folder_prefixes[remote_file.folder_path] = folder_prefix
         filename = _safe_filename(remote_file)
-        candidate = course_root / folder_path / filename
+        candidate = os.path.join(folder_prefix, filename)
+        planned_key = unicodedata.normalize("NFC", candidate).casefold()
 
-        if candidate in planned and planned[candidate] != remote_file.file_id:
-            stem = candidate.stem
-            suffix = candidate.suffix
-            candidate = candidate.with_name(f"{stem}_{remote_file.file_id}{suffix}")
+        if planned_key in planned and planned[planned_key] != remote_file.file_id:
+            stem, suffix = os.path.splitext(candidate)
+            candidate = f"{stem}_{remote_file.file_id}{suffix}"
+            planned_key = unicodedata.normalize("NFC", candidate).casefold()
 
-        planned[candidate] = remote_file.file_id
+        planned[planned_key] = remote_file.file_id
         tasks.append(
             DownloadTask(
                 course_id=course.id,
                 course_slug=course_slug,
                 file=remote_file,
-                local_path=candidate,
+                local_path=Path(candidate),
             )
         )
 
     return tasks
 
 
-def _is_unchanged(task: DownloadTask, previous_item: dict[str, Any] | None) -> bool:
+def _existing_names(parent: str, cache: dict[str, frozenset[str]]) -> frozenset[str]:
+    names = cache.get(parent)
+    if names is None:
+        try:
+            names = frozenset(entry.name for entry in os.scandir(parent))
+        except OSError:
+            names = frozenset()
+        cache[parent] = names
+    return names
+
+
+def _is_unchanged(
+    task: DownloadTask,
+    previous_item: dict[str, Any] | None,
+    scandir_cache: dict[str, frozenset[str]],
+) -> bool:
     if previous_item is None:
         return False
     if previous_item.get("status") != "downloaded":
         return False
-    if not task.local_path.exists():
+    # One scandir per directory instead of one stat per file: a mostly
+    # up-to-date course would otherwise issue thousands of exists() syscalls
+    # before the first download starts.
+    if task.local_path.name not in _existing_names(str(task.local_path.parent), scandir_cache):
         return False
 
     previous_size = previous_item.get("size")
@@ -136,9 +186,52 @@ def _is_unchanged(task: DownloadTask, previous_item: dict[str, Any] | None) -> b
     return True
 
 
-def _download_one(client: CanvasClient, task: DownloadTask) -> DownloadResult:
+def _normalize_etag(value: str | None) -> str | None:
+    """Canonicalize an ETag for revalidation.
+
+    CDN edges serve the same entity as either ``W/"abc"`` or ``"abc"``; drop
+    the weak prefix and re-quote bare tags so the If-None-Match we send
+    matches regardless of which edge wrote the manifest entry.
+    """
+    if not value:
+        return None
+    tag = value[2:] if value.startswith("W/") else value
+    if not tag.startswith('"'):
+        tag = f'"{tag}"'
+    return tag
+
+
+def _not_modified_result(task: DownloadTask, etag: str) -> DownloadResult:
+    # 304 Not Modified: the bytes on disk are still current. Reported as
+    # "skipped" so the manifest merge reuses the previous item unchanged.
+    return DownloadResult(
+        task=task,
+        status="skipped",
+        bytes_downloaded=0,
+        retries=0,
+        error=None,
+        sha256=None,
+        etag=etag,
+    )
+
+
+def _download_one(
+    client: CanvasClient,
+    task: DownloadTask,
+    if_none_match: str | None = None,
+) -> DownloadResult:
     try:
-        bytes_downloaded, sha256, etag = client.download_file(task.file.download_url, task.local_path)
+        # Only pass the conditional header when we have an ETag: duck-typed
+        # clients are not required to accept the keyword.
+        if if_none_match:
+            outcome = client.download_file(
+                task.file.download_url, task.local_path, if_none_match=if_none_match
+            )
+        else:
+            outcome = client.download_file(task.file.download_url, task.local_path)
+        if outcome is None:
+            return _not_modified_result(task, if_none_match or "")
+        bytes_downloaded, sha256, etag = outcome
         return DownloadResult(
             task=task,
             status="downloaded",
@@ -167,16 +260,23 @@ def download_tasks(
     previous_items_by_file_id: dict[int, dict[str, Any]] | None,
     force: bool,
     concurrency: int,
-    console: Console,
+    console: Console | None = None,
 ) -> list[DownloadResult]:
+    """Run the tasks, returning one result per task.
+
+    ``console`` enables the Rich progress bar; pass ``None`` to download
+    without any rendering (tests, embedders).
+    """
     previous_items = previous_items_by_file_id or {}
 
     scheduled: list[DownloadTask] = []
     results: list[DownloadResult] = []
+    scandir_cache: dict[str, frozenset[str]] = {}
+    conditional_etags: dict[int, str] = {}
 
     for task in tasks:
         previous_item = previous_items.get(task.file.file_id)
-        if not force and _is_unchanged(task, previous_item):
+        if not force and _is_unchanged(task, previous_item, scandir_cache):
             results.append(
                 DownloadResult(
                     task=task,
@@ -189,10 +289,43 @@ def download_tasks(
                 )
             )
             continue
+        # Metadata said "maybe changed" but we still hold the previous bytes
+        # and an ETag: ask the server with If-None-Match so an unchanged file
+        # costs a header exchange instead of a re-download.
+        if (
+            not force
+            and previous_item is not None
+            and previous_item.get("status") == "downloaded"
+            and type(raw_etag := previous_item.get("etag")) is str
+            and (etag := _normalize_etag(raw_etag))
+            and task.local_path.name in _existing_names(str(task.local_path.parent), scandir_cache)
+        ):
+            conditional_etags[task.file.file_id] = etag
         scheduled.append(task)
 
-    if scheduled:
-        max_workers = max(1, concurrency)
+    def run_scheduled(on_result: Callable[[DownloadResult], None]) -> None:
+        if hasattr(client, "async_clone"):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(
+                    _download_scheduled_async(
+                        client, scheduled, concurrency, on_result, conditional_etags
+                    )
+                )
+                return
+            # Already inside an event loop — FastMCP runs sync tools inline on
+            # its loop, where asyncio.run() raises. Fall through to the thread
+            # pool, which only needs the blocking download_file.
+        _download_scheduled_threaded(
+            client, scheduled, concurrency, on_result, conditional_etags
+        )
+
+    if scheduled and console is None:
+        run_scheduled(results.append)
+    elif scheduled:
+        from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
         progress = Progress(
             SpinnerColumn(),
             TextColumn("{task.description}"),
@@ -206,19 +339,103 @@ def download_tasks(
                 "Downloading files",
                 total=len(scheduled),
             )
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_map = {
-                    executor.submit(_download_one, client, task): task for task in scheduled
-                }
-                for future in as_completed(future_map):
-                    result = future.result()
-                    results.append(result)
-                    progress.advance(progress_task_id)
+
+            # Batch bar advances to ~10 Hz: each advance() takes rich's
+            # render lock, and with many small files the per-task renders
+            # cost more than the transfers.
+            pending_advances = 0
+            last_render = time.monotonic()
+
+            def on_result(result: DownloadResult) -> None:
+                nonlocal pending_advances, last_render
+                results.append(result)
+                pending_advances += 1
+                now = time.monotonic()
+                if now - last_render >= 0.1:
+                    progress.advance(progress_task_id, pending_advances)
+                    pending_advances = 0
+                    last_render = now
+
+            run_scheduled(on_result)
+
+            if pending_advances:
+                progress.advance(progress_task_id, pending_advances)
 
     results.sort(key=lambda result: (result.task.course_id, result.task.file.file_id, result.status))
     return results
 
 
+def _download_scheduled_threaded(
+    client: CanvasClient,
+    scheduled: list[DownloadTask],
+    concurrency: int,
+    on_result: Callable[[DownloadResult], None],
+    conditional_etags: dict[int, str],
+) -> None:
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        future_map = {
+            executor.submit(
+                _download_one, client, task, conditional_etags.get(task.file.file_id)
+            ): task
+            for task in scheduled
+        }
+        for future in as_completed(future_map):
+            on_result(future.result())
+
+
+async def _download_scheduled_async(
+    client: CanvasClient,
+    scheduled: list[DownloadTask],
+    concurrency: int,
+    on_result: Callable[[DownloadResult], None],
+    conditional_etags: dict[int, str],
+) -> None:
+    # One event loop and a few HTTP/2 connections multiplex all transfers,
+    # instead of one blocking socket (and OS thread) per worker.
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async with client.async_clone() as async_client:
+
+        async def download_one(task: DownloadTask) -> None:
+            async with semaphore:
+                if_none_match = conditional_etags.get(task.file.file_id)
+                try:
+                    if if_none_match:
+                        outcome = await async_client.download_file(
+                            task.file.download_url, task.local_path, if_none_match=if_none_match
+                        )
+                    else:
+                        outcome = await async_client.download_file(
+                            task.file.download_url, task.local_path
+                        )
+                    if outcome is None:
+                        on_result(_not_modified_result(task, if_none_match or ""))
+                        return
+                    bytes_downloaded, sha256, etag = outcome
+                    result = DownloadResult(
+                        task=task,
+                        status="downloaded",
+                        bytes_downloaded=bytes_downloaded,
+                        retries=0,
+                        error=None,
+                        sha256=sha256,
+                        etag=etag,
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    result = DownloadResult(
+                        task=task,
+                        status="failed",
+                        bytes_downloaded=0,
+                        retries=0,
+                        error=str(exc),
+                        sha256=None,
+                        etag=None,
+                    )
+                on_result(result)
+
+        await asyncio.gather(*(download_one(task) for task in scheduled))
+
+
 def result_to_manifest_item(result: DownloadResult) -> dict[str, Any]:
     return {
         "file_id": result.task.file.file_id,
@@ -2,37 +2,53 @@ from __future__ import annotations
 
 import csv
 import json
-from dataclasses import asdict
+from dataclasses import fields
 from pathlib import Path
-
-from rich.table import Table
+from typing import TYPE_CHECKING
 
 from canvasctl.canvas_api import AssignmentGrade, CourseGrade
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# Field names resolved once at import: asdict() re-introspects the dataclass
+# and deep-copies every value on each call, which adds up across big exports.
+_COURSE_GRADE_FIELDS = tuple(f.name for f in fields(CourseGrade))
+_ASSIGNMENT_GRADE_FIELDS = tuple(f.name for f in fields(AssignmentGrade))
+
 
 def grade_to_dict(grade: CourseGrade) -> dict[str, str | int | float | None]:
-    return asdict(grade)
+    return {name: getattr(grade, name) for name in _COURSE_GRADE_FIELDS}
 
 
 def assignment_grade_to_dict(grade: AssignmentGrade) -> dict[str, str | int | float | None]:
-    return asdict(grade)
+    return {name: getattr(grade, name) for name in _ASSIGNMENT_GRADE_FIELDS}
 
 
 def sort_grades(grades: list[CourseGrade]) -> list[CourseGrade]:
+    # sorted(key=) already decorates once per element; the `or ""` guards keep
+    # the order defined when Canvas omits a code or name.
     return sorted(
         grades,
-        key=lambda g: (g.course_code.lower(), g.course_name.lower(), g.course_id),
+        key=lambda g: ((g.course_code or "").lower(), (g.course_name or "").lower(), g.course_id),
     )
 
 
 def sort_assignment_grades(grades: list[AssignmentGrade]) -> list[AssignmentGrade]:
     return sorted(
         grades,
-        key=lambda g: (g.assignment_name.lower(), g.assignment_id),
+        key=lambda g: ((g.assignment_name or "").lower(), g.assignment_id),
     )
 
 
 def render_grades_summary_table(grades: list[CourseGrade]) -> Table:
+    from rich.table import Table
+
     table = Table(title="Course Grades")
     table.add_column("ID", style="cyan", justify="right")
     table.add_column("Course Code", style="magenta")
@@ -58,6 +74,8 @@ def render_detailed_grades_table(
     course_grade: CourseGrade,
     assignment_grades: list[AssignmentGrade],
 ) -> Table:
+    from rich.table import Table
+
     title = f"Grades: {course_grade.course_code} - {course_grade.course_name}"
     table = Table(title=title)
     table.add_column("Assignment", style="bold")
@@ -98,6 +116,51 @@ def render_detailed_grades_table(
     return table
 
 
+def render_grades_summary_plain(grades: list[CourseGrade]) -> str:
+    """Tab-separated fallback for piped output; skips Rich's layout pass."""
+    lines = ["course_id\tcourse_code\tcourse_name\tletter_grade\tscore"]
+    for grade in grades:
+        score_str = f"{grade.current_score:.1f}" if grade.current_score is not None else "N/A"
+        lines.append(
+            "\t".join(
+                (
+                    str(grade.course_id),
+                    grade.course_code or "",
+                    grade.course_name or "",
+                    grade.current_grade or "N/A",
+                    score_str,
+                )
+            )
+        )
+    return "\n".join(lines) + "\n"
+
+
+def render_detailed_grades_plain(
+    course_grade: CourseGrade,
+    assignment_grades: list[AssignmentGrade],
+) -> str:
+    """Tab-separated fallback for piped output; skips Rich's layout pass."""
+    lines = [f"# {course_grade.course_code or ''} - {course_grade.course_name or ''}"]
+    lines.append("assignment\tscore\tpossible\tgrade\tstatus")
+    for ag in assignment_grades:
+        lines.append(
+            "\t".join(
+                (
+                    ag.assignment_name or "",
+                    str(ag.score) if ag.score is not None else "-",
+                    str(ag.points_possible) if ag.points_possible is not None else "-",
+                    ag.grade or "-",
+                    ag.workflow_state or "-",
+                )
+            )
+        )
+    overall_score = (
+        f"{course_grade.current_score:.1f}%" if course_grade.current_score is not None else "N/A"
+    )
+    lines.append(f"OVERALL\t{overall_score}\t\t{course_grade.current_grade or 'N/A'}\t")
+    return "\n".join(lines) + "\n"
+
+
 def _default_export_dir() -> Path:
     """Return the user's Downloads folder as the default export location."""
     return Path.home() / "Downloads"
@@ -111,24 +174,23 @@ def export_grades_csv(
     """Export grades to a CSV file and return the written path."""
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    with dest.open("w", newline="", encoding="utf-8") as fh:
+    with dest.open("w", newline="", encoding="utf-8", buffering=1 << 20) as fh:
+        writer = csv.writer(fh)
         if assignments_by_course is None:
-            writer = csv.writer(fh)
             writer.writerow(
                 ["course_id", "course_code", "course_name", "letter_grade", "score"]
             )
-            for g in grades:
-                writer.writerow(
-                    [
-                        g.course_id,
-                        g.course_code,
-                        g.course_name,
-                        g.current_grade or "",
-                        g.current_score if g.current_score is not None else "",
-                    ]
-                )
+            writer.writerows(
+                [
+                    g.course_id,
+                    g.course_code,
+                    g.course_name,
+                    g.current_grade or "",
+                    "" if g.current_score is None else g.current_score,
+                ]
+                for g in grades
+            )
         else:
-            writer = csv.writer(fh)
             writer.writerow(
                 [
                     "course_id",
@@ -145,25 +207,24 @@ def export_grades_csv(
                     "course_score",
                 ]
             )
-            for g in grades:
-                course_assignments = assignments_by_course.get(g.course_id, [])
-                for ag in course_assignments:
-                    writer.writerow(
-                        [
-                            g.course_id,
-                            g.course_code,
-                            g.course_name,
-                            ag.assignment_id,
-                            ag.assignment_name,
-                            ag.score if ag.score is not None else "",
-                            ag.points_possible if ag.points_possible is not None else "",
-                            ag.grade or "",
-                            ag.workflow_state or "",
-                            ag.submitted_at or "",
-                            g.current_grade or "",
-                            g.current_score if g.current_score is not None else "",
-                        ]
-                    )
+            writer.writerows(
+                [
+                    g.course_id,
+                    g.course_code,
+                    g.course_name,
+                    ag.assignment_id,
+                    ag.assignment_name,
+                    "" if ag.score is None else ag.score,
+                    "" if ag.points_possible is None else ag.points_possible,
+                    ag.grade or "",
+                    ag.workflow_state or "",
+                    ag.submitted_at or "",
+                    g.current_grade or "",
+                    "" if g.current_score is None else g.current_score,
+                ]
+                for g in grades
+                for ag in assignments_by_course.get(g.course_id, [])
+            )
 
     return dest
 
@@ -191,5 +252,10 @@ def export_grades_json(
                 }
             )
 
-    dest.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if orjson is not None:
+        dest.write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+    else:
+        dest.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
     return dest
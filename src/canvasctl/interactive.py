@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from canvasctl.canvas_api import CourseSummary
-from canvasctl.sources import ALL_SOURCES
+if TYPE_CHECKING:
+    from canvasctl.canvas_api import CourseSummary
 
 
 @dataclass(slots=True)
@@ -24,6 +24,8 @@ def _load_questionary() -> Any:
 
 
 def prompt_interactive_selection(courses: list[CourseSummary]) -> InteractiveSelection:
+    from canvasctl.sources import ALL_SOURCES
+
     questionary = _load_questionary()
 
     course_choices = [
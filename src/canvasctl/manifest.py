@@ -1,32 +1,111 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 
 def course_manifest_path(dest_root: Path, course_slug: str) -> Path:
     return dest_root / course_slug / ".canvasctl-manifest.json"
 
 
+# Parsed-manifest cache keyed on (path, mtime_ns, size): a run touches the
+# same course manifest several times, and the parse only needs to happen
+# again when the file on disk actually changed. Callers treat the payload
+# as read-only. Each entry is a mutable [mtime_ns, size, payload, index]
+# list; the file_id index is filled in lazily by index_items_by_file_id and
+# lives and dies with its entry, so rewriting a manifest (which pops the
+# entry) releases both the payload and its derived index. The manifest
+# preload pool in cli.py calls load_manifest from several threads, so every
+# read or mutation of the dict happens under _MANIFEST_LOCK; parsing and
+# index building stay outside the lock where they can.
+_MANIFEST_CACHE: dict[str, list[Any]] = {}
+_MANIFEST_LOCK = threading.Lock()
+
+
+def clear_manifest_cache() -> None:
+    with _MANIFEST_LOCK:
+        _MANIFEST_CACHE.clear()
+
+
 def load_manifest(path: Path) -> dict[str, Any]:
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return {}
-    return json.loads(path.read_text(encoding="utf-8"))
+    key = str(path)
+    with _MANIFEST_LOCK:
+        cached = _MANIFEST_CACHE.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+    # Parse straight from bytes: no intermediate str copy, and orjson's
+    # decoder when the optional accelerator is installed.
+    data = path.read_bytes()
+    payload = orjson.loads(data) if orjson is not None else json.loads(data)
+    with _MANIFEST_LOCK:
+        _MANIFEST_CACHE[key] = [stat.st_mtime_ns, stat.st_size, payload, None]
+    return payload
+
+
+def _build_file_id_index(payload: dict[str, Any]) -> dict[int, dict[str, Any]]:
+    # Exact type check: manifests are JSON we wrote ourselves, so no int
+    # subclasses to worry about, and type() is cheaper per item. The dict
+    # comprehension builds the map in a single specialized loop instead of
+    # repeated __setitem__ calls.
+    return {
+        file_id: item
+        for item in payload.get("items") or ()
+        if type(file_id := item.get("file_id")) is int
+    }
 
 
 def index_items_by_file_id(payload: dict[str, Any]) -> dict[int, dict[str, Any]]:
-    out: dict[int, dict[str, Any]] = {}
-    for item in payload.get("items", []):
-        file_id = item.get("file_id")
-        if isinstance(file_id, int):
-            out[file_id] = item
-    return out
+    with _MANIFEST_LOCK:
+        entry = next(
+            (candidate for candidate in _MANIFEST_CACHE.values() if candidate[2] is payload),
+            None,
+        )
+        if entry is not None and entry[3] is not None:
+            return entry[3]
+    index = _build_file_id_index(payload)
+    if entry is not None:
+        # Benign race: a concurrent builder for the same payload produces an
+        # equal index, and the single slot store keeps whichever lands last.
+        entry[3] = index
+    # Ad-hoc payloads (not loaded through load_manifest) are not memoized,
+    # since there is no cache entry to tie the index's lifetime to.
+    return index
 
 
 def write_manifest(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    # Write to a temp file and atomically swap it into place so a crashed run
+    # never leaves a torn manifest behind. orjson encodes straight to bytes
+    # in C; the stdlib fallback streams the encoder output instead of
+    # materializing the whole document as one string.
+    temp_path = path.with_name(path.name + ".tmp")
+    if orjson is not None:
+        with temp_path.open("wb") as handle:
+            handle.write(
+                orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+    else:
+        with temp_path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+            handle.flush()
+            os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+    with _MANIFEST_LOCK:
+        _MANIFEST_CACHE.pop(str(path), None)
 
 
 def write_course_manifest(dest_root: Path, course_slug: str, payload: dict[str, Any]) -> Path:
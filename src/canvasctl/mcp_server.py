@@ -11,6 +11,7 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime, timedelta
+from itertools import chain
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -754,9 +755,11 @@ def sync_course_files(
             console=Console(quiet=True),
         )
 
-        manifest_items = [result_to_manifest_item(r) for r in results]
-        manifest_items.extend(
-            warning_to_manifest_item(w, course_id=course_id) for w in warnings
+        manifest_items = list(
+            chain(
+                (result_to_manifest_item(r) for r in results),
+                (warning_to_manifest_item(w, course_id=course_id) for w in warnings),
+            )
         )
 
         run_id = str(uuid.uuid4())
@@ -1,107 +1,138 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Any, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Any, Callable, Iterable, NamedTuple
 
 from canvasctl.canvas_api import CanvasApiError, CanvasClient, RemoteFile
 
 ALL_SOURCES = ("files", "assignments", "discussions", "pages", "modules")
-_FILE_ID_PATTERNS = (
-    re.compile(r"/files/(\d+)(?:/download)?"),
-    re.compile(r"/api/v1/files/(\d+)"),
-)
+_ALL_SOURCES_SET = frozenset(ALL_SOURCES)
+# Case-insensitive search beats lowercasing whole HTML bodies just to look
+# for one literal.
+_FILES_LITERAL_RE = re.compile(r"/files/", re.IGNORECASE)
 
 
-@dataclass(slots=True)
-class SourceWarning:
+class SourceWarning(NamedTuple):
+    # NamedTuple over a dataclass: warnings can pile up by the hundreds on
+    # link-heavy courses, and the tuple-backed constructor is much cheaper.
     source_type: str
     source_ref: str
     detail: str
 
 
-def normalize_sources(selected: Iterable[str] | None) -> list[str]:
-    if not selected:
-        return list(ALL_SOURCES)
+@lru_cache(maxsize=16)
+def _normalize_sources_cached(selected: tuple[str, ...]) -> tuple[str, ...]:
     normalized: list[str] = []
     for source in selected:
-        if source not in ALL_SOURCES:
+        if source not in _ALL_SOURCES_SET:
             raise ValueError(f"Unsupported source type: {source}")
         if source not in normalized:
             normalized.append(source)
-    return normalized
+    return tuple(normalized)
+
+
+def normalize_sources(selected: Iterable[str] | None) -> list[str]:
+    # Multi-course syncs re-normalize the same selection per course; the
+    # tuple-keyed cache turns the repeat validations into one dict hit.
+    selected = tuple(selected) if selected is not None else ()
+    if not selected:
+        return list(ALL_SOURCES)
+    return list(_normalize_sources_cached(selected))
 
 
 def extract_file_ids_from_text(text: str) -> set[int]:
+    # Hand-rolled scan instead of a regex: every file-link form (web and
+    # /api/v1/) puts the ID right after a "/files/" literal, so str.find plus
+    # a digit loop covers both without regex-engine setup per string. The
+    # common no-link case is a single C-level find.
     found: set[int] = set()
-    for pattern in _FILE_ID_PATTERNS:
-        for match in pattern.findall(text):
-            try:
-                found.add(int(match))
-            except ValueError:
-                continue
+    idx = text.find("/files/")
+    if idx == -1:
+        return found
+    length = len(text)
+    while idx != -1:
+        start = idx + 7
+        end = start
+        while end < length and "0" <= text[end] <= "9":
+            end += 1
+        if end > start:
+            found.add(int(text[start:end]))
+        idx = text.find("/files/", end)
     return found
 
 
 def _coerce_int(value: Any) -> int | None:
-    if isinstance(value, int):
+    # Exact type checks on the hot path: cheaper than isinstance, and they
+    # also reject bools, which are int subclasses but never valid file IDs.
+    t = type(value)
+    if t is int:
         return value
-    if isinstance(value, str) and value.isdigit():
+    if t is str and value.isdigit():
         return int(value)
     return None
 
 
-def _iter_strings(payload: Any) -> Iterable[str]:
-    if isinstance(payload, str):
-        yield payload
-        return
-    if isinstance(payload, list):
-        for item in payload:
-            yield from _iter_strings(item)
-        return
-    if isinstance(payload, dict):
-        for value in payload.values():
-            yield from _iter_strings(value)
+_FILE_ID_KEYS = frozenset({"file_id", "attachment_id", "content_id"})
 
 
-def extract_file_ids_from_payload(payload: Any) -> set[int]:
-    file_ids: set[int] = set()
+def _scan_text(text: str, file_ids: set[int]) -> bool:
+    """Collect file IDs from one string; return True on a dead-end link.
+
+    A dead-end is a ``/files/`` mention from which no file ID could be
+    extracted.
+    """
+    found = extract_file_ids_from_text(text)
+    if found:
+        file_ids.update(found)
+        return False
+    return "/files/" in text or _FILES_LITERAL_RE.search(text) is not None
+
 
-    def walk(node: Any) -> None:
+def extract_file_ids_from_payload(payload: Any) -> tuple[set[int], bool]:
+    """Walk a payload once, returning (file_ids, saw_unresolved_link)."""
+    file_ids: set[int] = set()
+    unresolved = False
+
+    # Explicit stack instead of recursion: no per-node frame allocation, and
+    # deeply nested module/discussion payloads cannot hit the recursion limit.
+    # Unresolved-link detection rides along in the same pass instead of
+    # re-walking the payload afterwards.
+    # Bind the hot names to locals: LOAD_FAST in the inner loop instead of
+    # global/attribute lookups per node.
+    add_id = file_ids.add
+    coerce = _coerce_int
+    scan_text = _scan_text
+    id_keys = _FILE_ID_KEYS
+
+    stack: list[Any] = [payload]
+    push = stack.append
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
             if "attachments" in node and isinstance(node["attachments"], list):
                 for attachment in node["attachments"]:
                     if isinstance(attachment, dict):
-                        maybe_id = _coerce_int(attachment.get("id"))
+                        maybe_id = coerce(attachment.get("id"))
                         if maybe_id is not None:
-                            file_ids.add(maybe_id)
+                            add_id(maybe_id)
             for key, value in node.items():
-                if key in {"file_id", "attachment_id", "content_id"}:
-                    maybe_id = _coerce_int(value)
+                if key in id_keys:
+                    maybe_id = coerce(value)
                     if maybe_id is not None:
-                        file_ids.add(maybe_id)
+                        add_id(maybe_id)
                 if isinstance(value, str):
-                    file_ids.update(extract_file_ids_from_text(value))
+                    unresolved = scan_text(value, file_ids) or unresolved
                 else:
-                    walk(value)
-            return
-        if isinstance(node, list):
-            for item in node:
-                walk(item)
-            return
-        if isinstance(node, str):
-            file_ids.update(extract_file_ids_from_text(node))
-
-    walk(payload)
-    return file_ids
+                    push(value)
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, str):
+            unresolved = scan_text(node, file_ids) or unresolved
 
-
-def _has_unresolved_file_link(payload: Any) -> bool:
-    for text in _iter_strings(payload):
-        lowered = text.lower()
-        if "/files/" in lowered and not extract_file_ids_from_text(text):
-            return True
-    return False
+    return file_ids, unresolved
 
 
 def _source_ref(source_type: str, item: dict[str, Any]) -> str:
@@ -148,16 +179,21 @@ def _remote_file_from_payload(
     )
 
 
+# Dispatch by method name (not unbound CanvasClient methods) so duck-typed
+# clients keep working.
+_SOURCE_METHODS = {
+    "assignments": "list_assignments",
+    "discussions": "list_discussions",
+    "pages": "list_pages",
+    "modules": "list_modules",
+}
+
+
 def _collect_source_items(client: CanvasClient, course_id: int, source_type: str) -> list[dict[str, Any]]:
-    if source_type == "assignments":
-        return client.list_assignments(course_id)
-    if source_type == "discussions":
-        return client.list_discussions(course_id)
-    if source_type == "pages":
-        return client.list_pages(course_id)
-    if source_type == "modules":
-        return client.list_modules(course_id)
-    raise ValueError(f"Unsupported source type: {source_type}")
+    method_name = _SOURCE_METHODS.get(source_type)
+    if method_name is None:
+        raise ValueError(f"Unsupported source type: {source_type}")
+    return getattr(client, method_name)(course_id)
 
 
 def collect_remote_files_for_course(
@@ -167,29 +203,52 @@ def collect_remote_files_for_course(
 ) -> tuple[list[RemoteFile], list[SourceWarning]]:
     normalized_sources = normalize_sources(sources)
     warnings: list[SourceWarning] = []
-    try:
-        folder_map = client.list_course_folders(course_id)
-    except CanvasApiError as exc:
-        folder_map = {}
+    item_sources = [s for s in normalized_sources if s != "files"]
+
+    # Every listing is an independent paginated HTTP call; issue them all in
+    # one concurrent batch so listing a course costs max(latencies) rather
+    # than their sum. Results are then processed in a fixed order (folders,
+    # files, item sources) to keep warning and discovery precedence
+    # deterministic.
+    jobs: list[tuple[str, Callable[[], Any]]] = [
+        ("folders", partial(client.list_course_folders, course_id))
+    ]
+    if "files" in normalized_sources:
+        jobs.append(("files", partial(client.list_course_files, course_id)))
+    for source_type in item_sources:
+        jobs.append((source_type, partial(_collect_source_items, client, course_id, source_type)))
+
+    def run_job(job: tuple[str, Callable[[], Any]]) -> tuple[str, Any]:
+        name, fn = job
+        try:
+            return name, fn()
+        except CanvasApiError as exc:
+            return name, exc
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        fetched: dict[str, Any] = dict(executor.map(run_job, jobs))
+
+    folder_map = fetched["folders"]
+    if isinstance(folder_map, CanvasApiError):
         warnings.append(
             SourceWarning(
                 source_type="files",
                 source_ref=f"files:course:{course_id}",
-                detail=f"Could not list course folders: {exc}",
+                detail=f"Could not list course folders: {folder_map}",
             )
         )
+        folder_map = {}
 
     file_map: dict[int, RemoteFile] = {}
 
     if "files" in normalized_sources:
-        try:
-            file_payloads = client.list_course_files(course_id)
-        except CanvasApiError as exc:
+        file_payloads = fetched["files"]
+        if isinstance(file_payloads, CanvasApiError):
             warnings.append(
                 SourceWarning(
                     source_type="files",
                     source_ref=f"files:course:{course_id}",
-                    detail=f"Skipping files source: {exc}",
+                    detail=f"Skipping files source: {file_payloads}",
                 )
             )
             file_payloads = []
@@ -211,26 +270,22 @@ def collect_remote_files_for_course(
 
     discovered_by_source: dict[int, tuple[str, str]] = {}
 
-    for source_type in normalized_sources:
-        if source_type == "files":
-            continue
-
-        try:
-            items = _collect_source_items(client, course_id, source_type)
-        except CanvasApiError as exc:
+    for source_type in item_sources:
+        items = fetched[source_type]
+        if isinstance(items, CanvasApiError):
             warnings.append(
                 SourceWarning(
                     source_type=source_type,
                     source_ref=f"{source_type}:course:{course_id}",
-                    detail=f"Skipping {source_type} source: {exc}",
+                    detail=f"Skipping {source_type} source: {items}",
                 )
             )
             continue
 
         for item in items:
             source_ref = _source_ref(source_type, item)
-            file_ids = extract_file_ids_from_payload(item)
-            if not file_ids and _has_unresolved_file_link(item):
+            file_ids, saw_unresolved = extract_file_ids_from_payload(item)
+            if not file_ids and saw_unresolved:
                 warnings.append(
                     SourceWarning(
                         source_type=source_type,
@@ -241,49 +296,79 @@ def collect_remote_files_for_course(
             for file_id in file_ids:
                 discovered_by_source.setdefault(file_id, (source_type, source_ref))
 
-    for file_id, (source_type, source_ref) in discovered_by_source.items():
-        if file_id in file_map:
-            continue
-        try:
-            payload = client.get_file(file_id)
-            remote = _remote_file_from_payload(
-                payload,
-                course_id=course_id,
-                folder_map=folder_map,
-                source_type=source_type,
-                source_ref=source_ref,
-            )
-            file_map[remote.file_id] = remote
-        except CanvasApiError as exc:
-            warnings.append(
-                SourceWarning(
-                    source_type=source_type,
-                    source_ref=source_ref,
-                    detail=f"Could not resolve file_id={file_id}: {exc}",
+    to_resolve = [
+        (file_id, source_type, source_ref)
+        for file_id, (source_type, source_ref) in discovered_by_source.items()
+        if file_id not in file_map
+    ]
+    if to_resolve:
+        # Each lookup is a full HTTP round-trip; fetching them in parallel
+        # turns N sequential RTTs into roughly one batch. executor.map keeps
+        # result (and therefore warning) order deterministic.
+        def fetch(entry: tuple[int, str, str]) -> tuple[int, str, str, dict[str, Any] | None, str | None]:
+            file_id, source_type, source_ref = entry
+            try:
+                return file_id, source_type, source_ref, client.get_file(file_id), None
+            except CanvasApiError as exc:
+                return file_id, source_type, source_ref, None, str(exc)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(to_resolve))) as executor:
+            for file_id, source_type, source_ref, payload, error in executor.map(fetch, to_resolve):
+                if payload is not None:
+                    try:
+                        remote = _remote_file_from_payload(
+                            payload,
+                            course_id=course_id,
+                            folder_map=folder_map,
+                            source_type=source_type,
+                            source_ref=source_ref,
+                        )
+                    except CanvasApiError as exc:
+                        error = str(exc)
+                    else:
+                        file_map[remote.file_id] = remote
+                        continue
+                warnings.append(
+                    SourceWarning(
+                        source_type=source_type,
+                        source_ref=source_ref,
+                        detail=f"Could not resolve file_id={file_id}: {error}",
+                    )
                 )
-            )
 
-    ordered_files = sorted(file_map.values(), key=lambda item: item.file_id)
+    ordered_files = sorted(file_map.values(), key=attrgetter("file_id"))
     return ordered_files, warnings
 
 
+# Shared template for the constant fields; the per-warning dict is then a
+# C-level copy plus five key writes instead of a 13-key literal build.
+_WARNING_ITEM_TEMPLATE: dict[str, Any] = {
+    "file_id": None,
+    "course_id": None,
+    "display_name": None,
+    "source_type": None,
+    "source_ref": None,
+    "remote_url": None,
+    "local_path": None,
+    "size": None,
+    "updated_at": None,
+    "etag": None,
+    "sha256": None,
+    "status": "unresolved",
+    "error": None,
+}
+
+
 def warning_to_manifest_item(
     warning: SourceWarning,
     *,
     course_id: int,
 ) -> dict[str, Any]:
     return {
-        "file_id": None,
+        **_WARNING_ITEM_TEMPLATE,
         "course_id": course_id,
         "display_name": warning.detail,
         "source_type": warning.source_type,
         "source_ref": warning.source_ref,
-        "remote_url": None,
-        "local_path": None,
-        "size": None,
-        "updated_at": None,
-        "etag": None,
-        "sha256": None,
-        "status": "unresolved",
         "error": warning.detail,
     }
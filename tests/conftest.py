@@ -3,7 +3,35 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+from typer.testing import CliRunner
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    # One runner for the whole session: CliRunner keeps no per-invoke state
+    # (results carry their own), so sharing it skips repeated click setup.
+    return CliRunner()
+
+
+@pytest.fixture
+def patch_cli_client(monkeypatch):
+    """Apply the standard CLI patches: config, base URL, and client wiring."""
+    # Module object instead of dotted strings: skips monkeypatch's
+    # import-and-getattr resolution on every setattr.
+    from canvasctl import cli
+    from canvasctl.config import AppConfig
+
+    def apply(client, base_url: str = "https://canvas.test"):
+        # One AppConfig per test, not one per _load_config_or_fail call.
+        cfg = AppConfig(base_url=base_url)
+        monkeypatch.setattr(cli, "_load_config_or_fail", lambda: cfg)
+        monkeypatch.setattr(cli, "_resolve_base_url_or_fail", lambda _cfg, _override: base_url)
+        monkeypatch.setattr(cli, "_run_with_client", lambda _base_url, action: action(client))
+
+    return apply
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+
 import httpx
 import pytest
 import respx
 
-from canvasctl.canvas_api import CanvasClient
+from canvasctl.canvas_api import AsyncCanvasClient, CanvasClient
 
 
 def test_get_paginated_follows_next_link(monkeypatch):
@@ -146,3 +149,175 @@ def test_get_paginated_detects_loop(monkeypatch):
         with CanvasClient("https://canvas.test", "token") as client:
             with pytest.raises(RuntimeError, match="Pagination loop detected"):
                 client.get_paginated("/courses")
+
+
+def test_async_get_paginated_follows_next_link():
+    async def run() -> list:
+        async with AsyncCanvasClient("https://canvas.test", "token") as client:
+            return await client.get_paginated("/courses")
+
+    with respx.mock(assert_all_called=True) as router:
+        router.get("https://canvas.test/api/v1/courses").respond(
+            200,
+            json=[{"id": 1}],
+            headers={
+                "Link": '<https://canvas.test/api/v1/courses-page-2>; rel="next"'
+            },
+        )
+        router.get("https://canvas.test/api/v1/courses-page-2").respond(
+            200,
+            json=[{"id": 2}],
+        )
+
+        payload = asyncio.run(run())
+
+    assert payload == [{"id": 1}, {"id": 2}]
+
+
+def test_async_list_pages_fetches_details():
+    async def run() -> list:
+        async with AsyncCanvasClient("https://canvas.test", "token") as client:
+            return await client.list_pages(1)
+
+    with respx.mock(assert_all_called=True) as router:
+        router.get("https://canvas.test/api/v1/courses/1/pages").respond(
+            200,
+            json=[{"url": "intro"}, {"url": "syllabus"}, {"url": None}],
+        )
+        router.get("https://canvas.test/api/v1/courses/1/pages/intro").respond(
+            200,
+            json={"url": "intro", "body": "<p>intro</p>"},
+        )
+        router.get("https://canvas.test/api/v1/courses/1/pages/syllabus").respond(
+            200,
+            json={"url": "syllabus", "body": "<p>syllabus</p>"},
+        )
+
+        pages = asyncio.run(run())
+
+    assert [page["url"] for page in pages] == ["intro", "syllabus"]
+
+
+def test_get_json_returns_cached_payload_on_304(monkeypatch):
+    monkeypatch.setattr("canvasctl.canvas_api.time.sleep", lambda _: None)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"abc123"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": 7}, headers={"ETag": '"abc123"'})
+
+    with respx.mock(assert_all_called=True) as router:
+        router.get("https://canvas.test/api/v1/users/self/profile").mock(side_effect=handler)
+
+        with CanvasClient("https://canvas.test", "token") as client:
+            first = client.get_json("users/self/profile")
+            second = client.get_json("users/self/profile")
+
+    assert first == {"id": 7}
+    assert second == {"id": 7}
+
+
+def test_download_file_writes_atomically(monkeypatch, tmp_path):
+    monkeypatch.setattr("canvasctl.canvas_api.time.sleep", lambda _: None)
+    destination = tmp_path / "intro.pdf"
+
+    with respx.mock(assert_all_called=True) as router:
+        router.get("https://canvas.test/files/1/download").respond(
+            200, content=b"abc", headers={"ETag": '"abc"'}
+        )
+
+        with CanvasClient("https://canvas.test", "token") as client:
+            size, digest, etag = client.download_file(
+                "https://canvas.test/files/1/download", destination
+            )
+
+    assert size == 3
+    assert etag == '"abc"'
+    assert destination.read_bytes() == b"abc"
+    # The .part staging file must be gone after the atomic rename.
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+# iter_bytes only flushes full 1 MiB chunks, so the interrupted body must
+# exceed one chunk for anything to reach the .part file before the failure.
+_RESUME_BODY = b"a" * (1 << 20) + b"tail-bytes"
+
+
+class _FlakyStream(httpx.SyncByteStream):
+    """Yields the body then dies mid-stream, like a dropped connection."""
+
+    def __iter__(self):
+        yield _RESUME_BODY
+        raise httpx.ReadError("interrupted")
+
+
+def test_download_file_resumes_with_if_range(monkeypatch, tmp_path):
+    monkeypatch.setattr("canvasctl.canvas_api.time.sleep", lambda _: None)
+    destination = tmp_path / "intro.pdf"
+    seen_headers: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        if len(seen_headers) == 1:
+            return httpx.Response(200, stream=_FlakyStream(), headers={"ETag": '"v1"'})
+        offset = int(request.headers["range"].removeprefix("bytes=").removesuffix("-"))
+        return httpx.Response(206, content=_RESUME_BODY[offset:], headers={"ETag": '"v1"'})
+
+    with respx.mock(assert_all_called=True) as router:
+        router.get("https://canvas.test/files/1/download").mock(side_effect=handler)
+
+        with CanvasClient("https://canvas.test", "token") as client:
+            size, digest, etag = client.download_file(
+                "https://canvas.test/files/1/download", destination
+            )
+
+    # The retry must make the resume conditional on the first attempt's ETag.
+    assert seen_headers[1]["range"] == f"bytes={1 << 20}-"
+    assert seen_headers[1]["if-range"] == '"v1"'
+    assert size == len(_RESUME_BODY)
+    assert etag == '"v1"'
+    assert destination.read_bytes() == _RESUME_BODY
+    assert digest == hashlib.sha256(_RESUME_BODY).hexdigest()
+
+
+def test_download_file_restarts_when_no_resume_validator(monkeypatch, tmp_path):
+    monkeypatch.setattr("canvasctl.canvas_api.time.sleep", lambda _: None)
+    destination = tmp_path / "intro.pdf"
+    seen_headers: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        if len(seen_headers) == 1:
+            return httpx.Response(200, stream=_FlakyStream())
+        return httpx.Response(200, content=_RESUME_BODY)
+
+    with respx.mock(assert_all_called=True) as router:
+        router.get("https://canvas.test/files/1/download").mock(side_effect=handler)
+
+        with CanvasClient("https://canvas.test", "token") as client:
+            size, digest, _etag = client.download_file(
+                "https://canvas.test/files/1/download", destination
+            )
+
+    # No ETag or Last-Modified on the first response: a blind Range resume
+    # could splice two entity versions, so the retry restarts from byte 0.
+    assert "range" not in seen_headers[1]
+    assert size == len(_RESUME_BODY)
+    assert destination.read_bytes() == _RESUME_BODY
+    assert digest == hashlib.sha256(_RESUME_BODY).hexdigest()
+
+
+def test_download_file_failure_leaves_no_partial(monkeypatch, tmp_path):
+    monkeypatch.setattr("canvasctl.canvas_api.time.sleep", lambda _: None)
+    destination = tmp_path / "intro.pdf"
+
+    with respx.mock(assert_all_called=True) as router:
+        router.get("https://canvas.test/files/1/download").respond(403, content=b"denied")
+
+        with CanvasClient("https://canvas.test", "token") as client:
+            with pytest.raises(Exception, match="403"):
+                client.download_file("https://canvas.test/files/1/download", destination)
+
+    # Neither the destination nor the .part file may survive a failed
+    # download; otherwise the next run's skip check could trust a half-file.
+    assert list(tmp_path.iterdir()) == []
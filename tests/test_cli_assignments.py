@@ -3,11 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from typer.testing import CliRunner
-
 from canvasctl.canvas_api import CourseSummary
 from canvasctl.cli import app
-from canvasctl.config import AppConfig
 
 
 class FakeClient:
@@ -74,25 +71,11 @@ class FakeClient:
         return {"id": 9001, "workflow_state": "submitted"}
 
 
-def _patch_common(monkeypatch, client):
-    monkeypatch.setattr(
-        "canvasctl.cli._load_config_or_fail",
-        lambda: AppConfig(base_url="https://canvas.test"),
-    )
-    monkeypatch.setattr(
-        "canvasctl.cli._resolve_base_url_or_fail",
-        lambda _cfg, _override: "https://canvas.test",
-    )
-    monkeypatch.setattr(
-        "canvasctl.cli._run_with_client",
-        lambda _base_url, action: action(client),
-    )
 
 
-def test_assignments_submit_file_success(monkeypatch, tmp_path):
-    runner = CliRunner()
+def test_assignments_submit_file_success(runner, monkeypatch, tmp_path, patch_cli_client):
     client = FakeClient()
-    _patch_common(monkeypatch, client)
+    patch_cli_client(client)
 
     local_file = tmp_path / "hw.py"
     local_file.write_text("print('ok')\n", encoding="utf-8")
@@ -116,10 +99,9 @@ def test_assignments_submit_file_success(monkeypatch, tmp_path):
     assert client.submissions[0][3] == {"file_ids": [7001]}
 
 
-def test_assignments_submit_text_json(monkeypatch):
-    runner = CliRunner()
+def test_assignments_submit_text_json(runner, monkeypatch, patch_cli_client):
     client = FakeClient()
-    _patch_common(monkeypatch, client)
+    patch_cli_client(client)
 
     result = runner.invoke(
         app,
@@ -143,10 +125,9 @@ def test_assignments_submit_text_json(monkeypatch):
     assert client.submissions[0][3] == {"body": "done"}
 
 
-def test_assignments_submit_url(monkeypatch):
-    runner = CliRunner()
+def test_assignments_submit_url(runner, monkeypatch, patch_cli_client):
     client = FakeClient()
-    _patch_common(monkeypatch, client)
+    patch_cli_client(client)
 
     result = runner.invoke(
         app,
@@ -167,10 +148,9 @@ def test_assignments_submit_url(monkeypatch):
     assert client.submissions[0][3] == {"url": "https://example.com/work"}
 
 
-def test_assignments_submit_ambiguous_assignment(monkeypatch):
-    runner = CliRunner()
+def test_assignments_submit_ambiguous_assignment(runner, monkeypatch, patch_cli_client):
     client = FakeClient()
-    _patch_common(monkeypatch, client)
+    patch_cli_client(client)
     client.list_assignments = lambda _course_id: [  # type: ignore[method-assign]
         {"id": 10, "name": "Homework", "submission_types": ["online_text_entry"], "html_url": "u1"},
         {"id": 20, "name": "Homework", "submission_types": ["online_text_entry"], "html_url": "u2"},
@@ -194,10 +174,9 @@ def test_assignments_submit_ambiguous_assignment(monkeypatch):
     assert "Ambiguous assignment selector" in result.output
 
 
-def test_assignments_submit_rejects_missing_file(monkeypatch):
-    runner = CliRunner()
+def test_assignments_submit_rejects_missing_file(runner, monkeypatch, patch_cli_client):
     client = FakeClient()
-    _patch_common(monkeypatch, client)
+    patch_cli_client(client)
 
     result = runner.invoke(
         app,
@@ -2,14 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from typer.testing import CliRunner
-
 from canvasctl import config
 from canvasctl.cli import app
 
 
-def test_config_set_download_path_persists(monkeypatch, tmp_path):
-    runner = CliRunner()
+def test_config_set_download_path_persists(runner, monkeypatch, tmp_path):
     monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
 
     destination = tmp_path / "my-downloads"
@@ -21,8 +18,7 @@ def test_config_set_download_path_persists(monkeypatch, tmp_path):
     assert loaded.default_dest == str(destination.resolve())
 
 
-def test_config_clear_download_path(monkeypatch, tmp_path):
-    runner = CliRunner()
+def test_config_clear_download_path(runner, monkeypatch, tmp_path):
     monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
     config.set_default_destination(tmp_path / "persisted")
 
@@ -34,8 +30,7 @@ def test_config_clear_download_path(monkeypatch, tmp_path):
     assert loaded.default_dest is None
 
 
-def test_config_show_includes_effective_dest(monkeypatch):
-    runner = CliRunner()
+def test_config_show_includes_effective_dest(runner, monkeypatch):
     configured = Path("/tmp/canvasctl-dest")
 
     monkeypatch.setattr(
@@ -1,52 +1,54 @@
 from __future__ import annotations
 
 import json
-
-from typer.testing import CliRunner
+from types import SimpleNamespace
 
 from canvasctl.canvas_api import CourseSummary
 from canvasctl.cli import app
-from canvasctl.config import AppConfig
-
-
-class FakeClient:
-    def list_courses(self, *, include_all: bool):
-        assert include_all is False
-        return [
-            CourseSummary(
-                id=100,
-                course_code="BIO101",
-                name="Biology",
-                workflow_state="available",
-                term_name="Spring",
-                start_at=None,
-                end_at=None,
-            )
-        ]
-
-
-class FakeClientWithWhitespace:
-    def list_courses(self, *, include_all: bool):
-        assert include_all is False
-        return [
-            CourseSummary(
-                id=101,
-                course_code=" MSDS Linear Algebra Requirement 2025",
-                name=" MSDS Linear Algebra Requirement 2025",
-                workflow_state="available",
-                term_name="Default Term",
-                start_at=None,
-                end_at=None,
-            )
-        ]
-
-
-def test_courses_list_json(monkeypatch):
-    runner = CliRunner()
-
-    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: AppConfig(base_url="https://canvas.test"))
-    monkeypatch.setattr("canvasctl.cli._resolve_base_url_or_fail", lambda _cfg, _override: "https://canvas.test")
-    monkeypatch.setattr("canvasctl.cli._run_with_client", lambda _base_url, action: action(FakeClient()))
+
+# Built once at import; tests only read them.
+_COURSES = [
+    CourseSummary(
+        id=100,
+        course_code="BIO101",
+        name="Biology",
+        workflow_state="available",
+        term_name="Spring",
+        start_at=None,
+        end_at=None,
+    )
+]
+
+_COURSES_WITH_WHITESPACE = [
+    CourseSummary(
+        id=101,
+        course_code=" MSDS Linear Algebra Requirement 2025",
+        name=" MSDS Linear Algebra Requirement 2025",
+        workflow_state="available",
+        term_name="Default Term",
+        start_at=None,
+        end_at=None,
+    )
+]
+
+
+def _list_courses(*, include_all: bool):
+    assert include_all is False
+    return _COURSES
+
+
+def _list_courses_with_whitespace(*, include_all: bool):
+    assert include_all is False
+    return _COURSES_WITH_WHITESPACE
+
+
+# SimpleNamespace fakes: no class definition or per-test instantiation needed.
+FAKE_CLIENT = SimpleNamespace(list_courses=_list_courses)
+FAKE_CLIENT_WITH_WHITESPACE = SimpleNamespace(list_courses=_list_courses_with_whitespace)
+
+
+def test_courses_list_json(runner, monkeypatch, patch_cli_client):
+    patch_cli_client(FAKE_CLIENT)
 
     result = runner.invoke(app, ["courses", "list", "--json"])
 
@@ -56,12 +58,8 @@ def test_courses_list_json(monkeypatch):
     assert parsed[0]["course_code"] == "BIO101"
 
 
-def test_courses_list_table(monkeypatch):
-    runner = CliRunner()
-
-    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: AppConfig(base_url="https://canvas.test"))
-    monkeypatch.setattr("canvasctl.cli._resolve_base_url_or_fail", lambda _cfg, _override: "https://canvas.test")
-    monkeypatch.setattr("canvasctl.cli._run_with_client", lambda _base_url, action: action(FakeClient()))
+def test_courses_list_table(runner, monkeypatch, patch_cli_client):
+    patch_cli_client(FAKE_CLIENT)
 
     result = runner.invoke(app, ["courses", "list"])
 
@@ -70,15 +68,12 @@ def test_courses_list_table(monkeypatch):
     assert "Biology" in result.output
 
 
-def test_courses_list_table_trims_leading_whitespace(monkeypatch):
-    runner = CliRunner()
-
-    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: AppConfig(base_url="https://canvas.test"))
-    monkeypatch.setattr("canvasctl.cli._resolve_base_url_or_fail", lambda _cfg, _override: "https://canvas.test")
-    monkeypatch.setattr("canvasctl.cli._run_with_client", lambda _base_url, action: action(FakeClientWithWhitespace()))
+def test_courses_list_table_trims_leading_whitespace(runner, monkeypatch, patch_cli_client):
+    patch_cli_client(FAKE_CLIENT_WITH_WHITESPACE)
 
     result = runner.invoke(app, ["courses", "list"])
 
     assert result.exit_code == 0
-    assert "│  MSDS Linear" not in result.output
-    assert "│ MSDS Linear" in result.output
+    # Piped output is tab-separated; the leading whitespace must be trimmed.
+    assert "\t MSDS Linear" not in result.output
+    assert "\tMSDS Linear" in result.output
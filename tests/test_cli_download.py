@@ -1,115 +1,115 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 
-from typer.testing import CliRunner
+import pytest
 
 from canvasctl.canvas_api import CourseSummary
 from canvasctl.cli import app
 from canvasctl.config import AppConfig
 from canvasctl.interactive import InteractiveSelection
 
+# Shared immutable-in-practice config: no need to rebuild it per patched call.
+_TEST_CFG = AppConfig(base_url="https://canvas.test")
 
-class FakeClient:
-    def list_courses(self, *, include_all: bool):
-        assert include_all is True
-        return [
-            CourseSummary(
-                id=1631791,
-                course_code="MSDS-697-01",
-                name="Distributed Data Systems",
-                workflow_state="available",
-                term_name="Spring 2026",
-                start_at=None,
-                end_at=None,
-            )
-        ]
-
-
-def _setup_common(monkeypatch, capture: dict[str, object]) -> None:
-    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: AppConfig(base_url="https://canvas.test"))
-    monkeypatch.setattr("canvasctl.cli._resolve_base_url_or_fail", lambda _cfg, _override: "https://canvas.test")
-    monkeypatch.setattr("canvasctl.cli._run_with_client", lambda _base_url, action: action(FakeClient()))
-
-    def fake_download_for_courses(**kwargs):
-        capture.update(kwargs)
-        return 0
-
-    monkeypatch.setattr("canvasctl.cli._download_for_courses", fake_download_for_courses)
-
-
-def test_download_run_default_overwrite_false(monkeypatch):
-    runner = CliRunner()
-    capture: dict[str, object] = {}
-    _setup_common(monkeypatch, capture)
 
-    result = runner.invoke(app, ["download", "run", "--course", "1631791"])
+# Built once at import; tests only read it.
+_COURSES = [
+    CourseSummary(
+        id=1631791,
+        course_code="MSDS-697-01",
+        name="Distributed Data Systems",
+        workflow_state="available",
+        term_name="Spring 2026",
+        start_at=None,
+        end_at=None,
+    )
+]
 
-    assert result.exit_code == 0
-    assert capture["force"] is False
 
+def _list_courses(*, include_all: bool):
+    assert include_all is True
+    return _COURSES
 
-def test_download_run_overwrite_true(monkeypatch):
-    runner = CliRunner()
-    capture: dict[str, object] = {}
-    _setup_common(monkeypatch, capture)
 
-    result = runner.invoke(
-        app,
-        ["download", "run", "--course", "1631791", "--overwrite", "true"],
-    )
+# SimpleNamespace fake: no class definition or per-test instantiation needed.
+FAKE_CLIENT = SimpleNamespace(list_courses=_list_courses)
 
-    assert result.exit_code == 0
-    assert capture["force"] is True
 
+def _setup_common(patch_cli_client, monkeypatch, capture: list[dict[str, object]]) -> None:
+    patch_cli_client(FAKE_CLIENT)
 
-def test_download_run_overwrite_false(monkeypatch):
-    runner = CliRunner()
-    capture: dict[str, object] = {}
-    _setup_common(monkeypatch, capture)
-
-    result = runner.invoke(
-        app,
-        ["download", "run", "--course", "1631791", "--overwrite=false"],
-    )
-
-    assert result.exit_code == 0
-    assert capture["force"] is False
+    def fake_download_for_courses(**kwargs):
+        # Keep the kwargs dict as-is; appending skips the per-key rehash that
+        # dict.update into a shared capture dict would do.
+        capture.append(kwargs)
+        return 0
 
+    monkeypatch.setattr("canvasctl.cli._download_for_courses", fake_download_for_courses)
 
-def test_download_run_force_conflicts_with_overwrite_false(monkeypatch):
-    runner = CliRunner()
-    capture: dict[str, object] = {}
-    _setup_common(monkeypatch, capture)
 
-    result = runner.invoke(
-        app,
-        ["download", "run", "--course", "1631791", "--force", "--overwrite", "false"],
-    )
+@pytest.mark.parametrize(
+    ("extra_args", "expected_force", "expected_error"),
+    [
+        ([], False, None),
+        (["--overwrite", "true"], True, None),
+        (["--overwrite=false"], False, None),
+        (["--force", "--overwrite", "false"], None, "Conflicting options"),
+    ],
+    ids=["default", "overwrite-true", "overwrite-false", "force-conflict"],
+)
+def test_download_run_overwrite_and_force(
+    runner, monkeypatch, patch_cli_client, extra_args, expected_force, expected_error
+):
+    capture: list[dict[str, object]] = []
+    _setup_common(patch_cli_client, monkeypatch, capture)
+
+    result = runner.invoke(app, ["download", "run", "--course", "1631791", *extra_args])
+
+    if expected_error is not None:
+        assert result.exit_code != 0
+        assert expected_error in result.output
+    else:
+        assert result.exit_code == 0
+        assert capture[0]["force"] is expected_force
+
+
+def test_download_run_rejects_non_decimal_digit_selector(runner, monkeypatch, patch_cli_client):
+    # "²".isdigit() is True but int("²") raises; the selector must fall
+    # through to the friendly mismatch error instead of a traceback.
+    capture: list[dict[str, object]] = []
+    _setup_common(patch_cli_client, monkeypatch, capture)
+
+    result = runner.invoke(app, ["download", "run", "--course", "²"])
 
     assert result.exit_code != 0
-    assert "Conflicting options" in result.output
+    assert "did not match" in result.output
+    assert capture == []
 
 
-def test_download_run_uses_dest_override(monkeypatch, tmp_path):
-    runner = CliRunner()
-    capture: dict[str, object] = {}
-    _setup_common(monkeypatch, capture)
+def test_download_run_uses_dest_override(runner, monkeypatch, tmp_path, patch_cli_client):
+    capture: list[dict[str, object]] = []
+    _setup_common(patch_cli_client, monkeypatch, capture)
 
-    destination = tmp_path / "custom-downloads"
+    # Resolve once up front; tmp_path is already absolute, and resolving in
+    # the assertion would repeat the stat() walk the CLI just did.
+    destination = (tmp_path / "custom-downloads").resolve()
+    # Only exit_code and the capture dict are asserted; skip traceback
+    # formatting on the happy path.
     result = runner.invoke(
         app,
         ["download", "run", "--course", "1631791", "--dest", str(destination)],
+        catch_exceptions=False,
     )
 
     assert result.exit_code == 0
-    assert capture["dest_root"] == destination.resolve()
+    assert capture[0]["dest_root"] == destination
 
 
-def test_download_run_export_dest_requires_dest(monkeypatch):
-    runner = CliRunner()
-    capture: dict[str, object] = {}
-    _setup_common(monkeypatch, capture)
+def test_download_run_export_dest_requires_dest(runner, monkeypatch, patch_cli_client):
+    capture: list[dict[str, object]] = []
+    _setup_common(patch_cli_client, monkeypatch, capture)
 
     result = runner.invoke(
         app,
@@ -120,10 +120,9 @@ def test_download_run_export_dest_requires_dest(monkeypatch):
     assert "--export-dest requires --dest" in result.output
 
 
-def test_download_run_export_dest_persists_destination(monkeypatch, tmp_path):
-    runner = CliRunner()
-    capture: dict[str, object] = {}
-    _setup_common(monkeypatch, capture)
+def test_download_run_export_dest_persists_destination(runner, monkeypatch, tmp_path, patch_cli_client):
+    capture: list[dict[str, object]] = []
+    _setup_common(patch_cli_client, monkeypatch, capture)
 
     saved: dict[str, Path] = {}
 
@@ -137,7 +136,7 @@ def test_download_run_export_dest_persists_destination(monkeypatch, tmp_path):
 
     monkeypatch.setattr("canvasctl.cli.set_default_destination", fake_set_default_destination)
 
-    destination = tmp_path / "persisted-downloads"
+    destination = (tmp_path / "persisted-downloads").resolve()
     result = runner.invoke(
         app,
         [
@@ -149,16 +148,17 @@ def test_download_run_export_dest_persists_destination(monkeypatch, tmp_path):
             str(destination),
             "--export-dest",
         ],
+        catch_exceptions=False,
     )
 
     assert result.exit_code == 0
-    assert saved["path"] == destination.resolve()
+    assert saved["path"] == destination
     assert "Saved default download path" in result.output
 
 
-def test_download_interactive_export_dest_requires_dest(monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: AppConfig(base_url="https://canvas.test"))
+@pytest.mark.slow
+def test_download_interactive_export_dest_requires_dest(runner, monkeypatch):
+    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: _TEST_CFG)
     monkeypatch.setattr("canvasctl.cli._resolve_base_url_or_fail", lambda _cfg, _override: "https://canvas.test")
 
     result = runner.invoke(app, ["download", "interactive", "--export-dest"])
@@ -167,9 +167,9 @@ def test_download_interactive_export_dest_requires_dest(monkeypatch):
     assert "--export-dest requires --dest" in result.output
 
 
-def test_download_interactive_handles_prompt_errors_without_traceback(monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: AppConfig(base_url="https://canvas.test"))
+@pytest.mark.slow
+def test_download_interactive_handles_prompt_errors_without_traceback(runner, monkeypatch):
+    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: _TEST_CFG)
     monkeypatch.setattr("canvasctl.cli._resolve_base_url_or_fail", lambda _cfg, _override: "https://canvas.test")
 
     class InteractiveClient:
@@ -192,7 +192,7 @@ def test_download_interactive_handles_prompt_errors_without_traceback(monkeypatc
         lambda _base_url, action: action(InteractiveClient()),
     )
     monkeypatch.setattr(
-        "canvasctl.cli.prompt_interactive_selection",
+        "canvasctl.interactive.prompt_interactive_selection",
         lambda _courses: (_ for _ in ()).throw(RuntimeError("No courses selected.")),
     )
 
@@ -203,9 +203,9 @@ def test_download_interactive_handles_prompt_errors_without_traceback(monkeypatc
     assert "Traceback" not in result.output
 
 
-def test_download_interactive_passes_selected_courses_and_sources(monkeypatch, tmp_path):
-    runner = CliRunner()
-    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: AppConfig(base_url="https://canvas.test"))
+@pytest.mark.slow
+def test_download_interactive_passes_selected_courses_and_sources(runner, monkeypatch, tmp_path):
+    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: _TEST_CFG)
     monkeypatch.setattr("canvasctl.cli._resolve_base_url_or_fail", lambda _cfg, _override: "https://canvas.test")
 
     class InteractiveClient:
@@ -232,14 +232,14 @@ def test_download_interactive_passes_selected_courses_and_sources(monkeypatch, t
                 ),
             ]
 
-    capture: dict[str, object] = {}
+    capture: list[dict[str, object]] = []
 
     monkeypatch.setattr(
         "canvasctl.cli._run_with_client",
         lambda _base_url, action: action(InteractiveClient()),
     )
     monkeypatch.setattr(
-        "canvasctl.cli.prompt_interactive_selection",
+        "canvasctl.interactive.prompt_interactive_selection",
         lambda _courses: InteractiveSelection(
             course_ids=[1631791, 9999999],
             sources=["files", "assignments"],
@@ -247,27 +247,31 @@ def test_download_interactive_passes_selected_courses_and_sources(monkeypatch, t
     )
 
     def fake_download_for_courses(**kwargs):
-        capture.update(kwargs)
+        capture.append(kwargs)
         return 0
 
     monkeypatch.setattr("canvasctl.cli._download_for_courses", fake_download_for_courses)
+    monkeypatch.setattr(
+        "canvasctl.sources.collect_remote_files_for_course",
+        lambda _client, course_id, _sources: ([], []),
+    )
 
-    destination = tmp_path / "interactive-downloads"
+    destination = (tmp_path / "interactive-downloads").resolve()
     result = runner.invoke(
         app,
         ["download", "interactive", "--dest", str(destination), "--force"],
     )
 
     assert result.exit_code == 0
-    assert [item.id for item in capture["selected_courses"]] == [1631791]
-    assert capture["sources"] == ["files", "assignments"]
-    assert capture["dest_root"] == destination.resolve()
-    assert capture["force"] is True
+    assert [item.id for item in capture[0]["selected_courses"]] == [1631791]
+    assert capture[0]["sources"] == ["files", "assignments"]
+    assert capture[0]["dest_root"] == destination
+    assert capture[0]["force"] is True
+    assert capture[0]["precomputed_remote_files"] == {1631791: ([], [])}
 
 
-def test_download_run_uses_course_path_when_configured(monkeypatch, tmp_path):
-    runner = CliRunner()
-    capture: dict[str, object] = {}
+def test_download_run_uses_course_path_when_configured(runner, monkeypatch, tmp_path):
+    capture: list[dict[str, object]] = []
 
     course_dest = tmp_path / "my-class"
     monkeypatch.setattr(
@@ -278,10 +282,10 @@ def test_download_run_uses_course_path_when_configured(monkeypatch, tmp_path):
         ),
     )
     monkeypatch.setattr("canvasctl.cli._resolve_base_url_or_fail", lambda _cfg, _override: "https://canvas.test")
-    monkeypatch.setattr("canvasctl.cli._run_with_client", lambda _base_url, action: action(FakeClient()))
+    monkeypatch.setattr("canvasctl.cli._run_with_client", lambda _base_url, action: action(FAKE_CLIENT))
 
     def fake_download_for_courses(**kwargs):
-        capture.update(kwargs)
+        capture.append(kwargs)
         return 0
 
     monkeypatch.setattr("canvasctl.cli._download_for_courses", fake_download_for_courses)
@@ -289,16 +293,15 @@ def test_download_run_uses_course_path_when_configured(monkeypatch, tmp_path):
     result = runner.invoke(app, ["download", "run", "--course", "1631791"])
 
     assert result.exit_code == 0
-    assert capture["course_paths"] == {"1631791": str(course_dest)}
+    assert capture[0]["course_paths"] == {"1631791": str(course_dest)}
 
 
-def test_config_set_course_path_command(monkeypatch, tmp_path):
+def test_config_set_course_path_command(runner, monkeypatch, tmp_path):
     from canvasctl import config
 
     monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
     config.save_config(AppConfig())
 
-    runner = CliRunner()
     result = runner.invoke(app, ["config", "set-course-path", "1631791", str(tmp_path / "my-class")])
 
     assert result.exit_code == 0
@@ -309,14 +312,13 @@ def test_config_set_course_path_command(monkeypatch, tmp_path):
     assert "1631791" in loaded.course_paths
 
 
-def test_config_clear_course_path_command(monkeypatch, tmp_path):
+def test_config_clear_course_path_command(runner, monkeypatch, tmp_path):
     from canvasctl import config
 
     monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
     config.save_config(AppConfig())
     config.set_course_path(1631791, tmp_path / "my-class")
 
-    runner = CliRunner()
     result = runner.invoke(app, ["config", "clear-course-path", "1631791"])
 
     assert result.exit_code == 0
@@ -326,13 +328,12 @@ def test_config_clear_course_path_command(monkeypatch, tmp_path):
     assert loaded.course_paths is None
 
 
-def test_config_show_course_paths_command(monkeypatch, tmp_path):
+def test_config_show_course_paths_command(runner, monkeypatch, tmp_path):
     from canvasctl import config
 
     monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
     config.save_config(AppConfig(course_paths={"1631791": "/tmp/my-class"}))
 
-    runner = CliRunner()
     result = runner.invoke(app, ["config", "show-course-paths"])
 
     assert result.exit_code == 0
@@ -340,22 +341,21 @@ def test_config_show_course_paths_command(monkeypatch, tmp_path):
     assert "/tmp/my-class" in result.output
 
 
-def test_config_show_course_paths_empty(monkeypatch, tmp_path):
+def test_config_show_course_paths_empty(runner, monkeypatch, tmp_path):
     from canvasctl import config
 
     monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
     config.save_config(AppConfig())
 
-    runner = CliRunner()
     result = runner.invoke(app, ["config", "show-course-paths"])
 
     assert result.exit_code == 0
     assert "No course paths configured." in result.output
 
 
-def test_download_interactive_fails_when_no_valid_courses_selected(monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: AppConfig(base_url="https://canvas.test"))
+@pytest.mark.slow
+def test_download_interactive_fails_when_no_valid_courses_selected(runner, monkeypatch):
+    monkeypatch.setattr("canvasctl.cli._load_config_or_fail", lambda: _TEST_CFG)
     monkeypatch.setattr("canvasctl.cli._resolve_base_url_or_fail", lambda _cfg, _override: "https://canvas.test")
 
     class InteractiveClient:
@@ -378,7 +378,7 @@ def test_download_interactive_fails_when_no_valid_courses_selected(monkeypatch):
         lambda _base_url, action: action(InteractiveClient()),
     )
     monkeypatch.setattr(
-        "canvasctl.cli.prompt_interactive_selection",
+        "canvasctl.interactive.prompt_interactive_selection",
         lambda _courses: InteractiveSelection(course_ids=[9999999], sources=["files"]),
     )
 
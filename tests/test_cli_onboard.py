@@ -3,7 +3,6 @@ from __future__ import annotations
 import io
 
 from rich.console import Console
-from typer.testing import CliRunner
 
 from canvasctl.canvas_api import CanvasApiError, CanvasUnauthorizedError, CourseSummary
 from canvasctl.cli import app
@@ -121,21 +120,21 @@ def _console_out(console: Console) -> str:
 # ---------------------------------------------------------------------------
 
 
-def test_onboard_command_registered():
+def test_onboard_command_registered(runner):
     """The onboard command exists and its help is accessible."""
-    result = CliRunner().invoke(app, ["onboard", "--help"])
+    result = runner.invoke(app, ["onboard", "--help"])
     assert result.exit_code == 0
     assert "setup wizard" in result.output.lower()
 
 
-def test_onboard_keyboard_interrupt_exits_cleanly(monkeypatch):
+def test_onboard_keyboard_interrupt_exits_cleanly(runner, monkeypatch):
     """KeyboardInterrupt inside onboard prints 'Setup cancelled' and exits 1."""
 
     def raise_kbi(_console):
         raise KeyboardInterrupt
 
     monkeypatch.setattr("canvasctl.onboard.run_onboard", raise_kbi)
-    result = CliRunner().invoke(app, ["onboard"])
+    result = runner.invoke(app, ["onboard"])
     assert result.exit_code == 1
     assert "cancelled" in result.output.lower()
 
@@ -145,7 +144,7 @@ def test_onboard_keyboard_interrupt_exits_cleanly(monkeypatch):
 # ---------------------------------------------------------------------------
 
 
-def test_step_base_url_already_set_keep(monkeypatch):
+def test_step_base_url_already_set_keep(runner, monkeypatch):
     """Existing URL + user keeps it: set_base_url is NOT called."""
     set_called = []
     monkeypatch.setattr(
@@ -162,7 +161,7 @@ def test_step_base_url_already_set_keep(monkeypatch):
     assert out_cfg.base_url == "https://canvas.test"
 
 
-def test_step_base_url_already_set_change(monkeypatch):
+def test_step_base_url_already_set_change(runner, monkeypatch):
     """Existing URL + user declines: new URL prompted and saved."""
     saved = []
     monkeypatch.setattr(
@@ -179,7 +178,7 @@ def test_step_base_url_already_set_change(monkeypatch):
     assert out_cfg.base_url == "https://new.canvas.example.com"
 
 
-def test_step_base_url_not_set_prompts_and_saves(monkeypatch):
+def test_step_base_url_not_set_prompts_and_saves(runner, monkeypatch):
     """No URL configured: prompts for one and saves it."""
     saved = []
     monkeypatch.setattr(
@@ -195,7 +194,7 @@ def test_step_base_url_not_set_prompts_and_saves(monkeypatch):
     assert out_cfg.base_url == "https://school.instructure.com"
 
 
-def test_step_base_url_empty_input_skips(monkeypatch):
+def test_step_base_url_empty_input_skips(runner, monkeypatch):
     """Empty URL entry leaves config unchanged (no save, base_url stays None)."""
     set_called = []
     monkeypatch.setattr(
@@ -216,7 +215,7 @@ def test_step_base_url_empty_input_skips(monkeypatch):
 # ---------------------------------------------------------------------------
 
 
-def test_step_token_env_accepted(monkeypatch):
+def test_step_token_env_accepted(runner, monkeypatch):
     """CANVAS_TOKEN set + user accepts: no password prompt, returns open client."""
     monkeypatch.setenv("CANVAS_TOKEN", "env-token-xyz")
     fake = FakeClient()
@@ -232,7 +231,7 @@ def test_step_token_env_accepted(monkeypatch):
     client.close()
 
 
-def test_step_token_env_declined_uses_password_prompt(monkeypatch):
+def test_step_token_env_declined_uses_password_prompt(runner, monkeypatch):
     """CANVAS_TOKEN set but user declines: password prompt used instead."""
     monkeypatch.setenv("CANVAS_TOKEN", "env-token-xyz")
     fake = FakeClient()
@@ -248,7 +247,7 @@ def test_step_token_env_declined_uses_password_prompt(monkeypatch):
     client.close()
 
 
-def test_step_token_no_env_prompts_password(monkeypatch):
+def test_step_token_no_env_prompts_password(runner, monkeypatch):
     """No CANVAS_TOKEN: password prompt shown and token verified."""
     monkeypatch.delenv("CANVAS_TOKEN", raising=False)
     fake = FakeClient()
@@ -264,7 +263,7 @@ def test_step_token_no_env_prompts_password(monkeypatch):
     client.close()
 
 
-def test_step_token_empty_password_returns_none(monkeypatch):
+def test_step_token_empty_password_returns_none(runner, monkeypatch):
     """Empty password input skips verification and returns None."""
     monkeypatch.delenv("CANVAS_TOKEN", raising=False)
     fq = FakeQuestionary("")
@@ -274,7 +273,7 @@ def test_step_token_empty_password_returns_none(monkeypatch):
     assert client is None
 
 
-def test_step_token_401_retry_with_new_token_succeeds(monkeypatch):
+def test_step_token_401_retry_with_new_token_succeeds(runner, monkeypatch):
     """401 on first attempt: user retries with different token, second attempt succeeds."""
     monkeypatch.delenv("CANVAS_TOKEN", raising=False)
 
@@ -300,7 +299,7 @@ def test_step_token_401_retry_with_new_token_succeeds(monkeypatch):
     assert call_count[0] == 2
 
 
-def test_step_token_401_no_retry_returns_none(monkeypatch):
+def test_step_token_401_no_retry_returns_none(runner, monkeypatch):
     """401 on first attempt, user declines retry: returns None."""
     monkeypatch.delenv("CANVAS_TOKEN", raising=False)
     fake = FakeClient(raise_on_first_call=CanvasUnauthorizedError("bad"))
@@ -317,7 +316,7 @@ def test_step_token_401_no_retry_returns_none(monkeypatch):
 # ---------------------------------------------------------------------------
 
 
-def test_step_show_courses_renders_table():
+def test_step_show_courses_renders_table(runner):
     """Courses table is printed and courses_count is set on result."""
     console = _console()
     result = OnboardResult()
@@ -330,7 +329,7 @@ def test_step_show_courses_renders_table():
     assert len(courses) == 2
 
 
-def test_step_show_courses_empty_prints_warning():
+def test_step_show_courses_empty_prints_warning(runner):
     """No active courses prints a warning and returns empty list."""
     console = _console()
     result = OnboardResult()
@@ -346,7 +345,7 @@ def test_step_show_courses_empty_prints_warning():
 # ---------------------------------------------------------------------------
 
 
-def test_step_download_single_path_saves_global(monkeypatch, tmp_path):
+def test_step_download_single_path_saves_global(runner, monkeypatch, tmp_path):
     """Choosing 'single' prompts for a path and calls set_default_destination."""
     saved = []
     monkeypatch.setattr(
@@ -364,7 +363,7 @@ def test_step_download_single_path_saves_global(monkeypatch, tmp_path):
     assert result.default_dest == str(tmp_path / "dl")
 
 
-def test_step_download_per_course_checkbox_then_paths(monkeypatch, tmp_path):
+def test_step_download_per_course_checkbox_then_paths(runner, monkeypatch, tmp_path):
     """Per-course: checkbox selects courses, path prompted for each selected."""
     saved = {}
     monkeypatch.setattr(
@@ -386,7 +385,7 @@ def test_step_download_per_course_checkbox_then_paths(monkeypatch, tmp_path):
     assert result.path_strategy == "per_course"
 
 
-def test_step_download_per_course_empty_path_skips_course(monkeypatch, tmp_path):
+def test_step_download_per_course_empty_path_skips_course(runner, monkeypatch, tmp_path):
     """Empty path for a course skips set_course_path for that course only."""
     saved = {}
     monkeypatch.setattr(
@@ -408,7 +407,7 @@ def test_step_download_per_course_empty_path_skips_course(monkeypatch, tmp_path)
     assert "200" in saved      # CS201 was saved
 
 
-def test_step_download_default_no_config_changes(monkeypatch):
+def test_step_download_default_no_config_changes(runner, monkeypatch):
     """Choosing 'default' makes no config changes and sets path_strategy."""
     mutations = []
     monkeypatch.setattr("canvasctl.onboard.set_default_destination", lambda p: mutations.append(p))
@@ -423,7 +422,7 @@ def test_step_download_default_no_config_changes(monkeypatch):
     assert result.path_strategy == "default"
 
 
-def test_step_download_skip_no_config_changes(monkeypatch):
+def test_step_download_skip_no_config_changes(runner, monkeypatch):
     """Choosing 'skip' makes no config changes."""
     mutations = []
     monkeypatch.setattr("canvasctl.onboard.set_default_destination", lambda p: mutations.append(p))
@@ -443,7 +442,7 @@ def test_step_download_skip_no_config_changes(monkeypatch):
 # ---------------------------------------------------------------------------
 
 
-def test_summary_shows_export_reminder_for_manual_token():
+def test_summary_shows_export_reminder_for_manual_token(runner):
     """Manually-entered token → 'export CANVAS_TOKEN' hint appears in summary."""
     console = _console()
     _step_summary(
@@ -458,7 +457,7 @@ def test_summary_shows_export_reminder_for_manual_token():
     assert "export CANVAS_TOKEN" in _console_out(console)
 
 
-def test_summary_no_export_reminder_for_env_token():
+def test_summary_no_export_reminder_for_env_token(runner):
     """Env-sourced token → no 'export CANVAS_TOKEN' hint in summary."""
     console = _console()
     _step_summary(
@@ -479,7 +478,7 @@ def test_summary_no_export_reminder_for_env_token():
 # ---------------------------------------------------------------------------
 
 
-def test_run_onboard_no_base_url_skips_downstream_steps(monkeypatch):
+def test_run_onboard_no_base_url_skips_downstream_steps(runner, monkeypatch):
     """If step 1 results in no base_url, token/courses/paths steps are not run."""
     monkeypatch.setattr("canvasctl.onboard.load_config", lambda: AppConfig())
     fq = FakeQuestionary("")  # empty URL → stays None
@@ -495,7 +494,7 @@ def test_run_onboard_no_base_url_skips_downstream_steps(monkeypatch):
     assert not client_created
 
 
-def test_run_onboard_client_always_closed_on_downstream_exception(monkeypatch):
+def test_run_onboard_client_always_closed_on_downstream_exception(runner, monkeypatch):
     """The CanvasClient is closed even when a later step raises."""
     monkeypatch.setattr(
         "canvasctl.onboard.load_config",
@@ -515,7 +514,7 @@ def test_run_onboard_client_always_closed_on_downstream_exception(monkeypatch):
     assert fake.closed
 
 
-def test_run_onboard_env_token_default_paths_succeeds(monkeypatch):
+def test_run_onboard_env_token_default_paths_succeeds(runner, monkeypatch):
     """Full happy-path: env token, keep URL, default download paths."""
     monkeypatch.setenv("CANVAS_TOKEN", "test-token")
     monkeypatch.setattr(
@@ -540,19 +539,19 @@ def test_run_onboard_env_token_default_paths_succeeds(monkeypatch):
 # ---------------------------------------------------------------------------
 
 
-def test_onboard_eoferror_exits_cleanly(monkeypatch):
+def test_onboard_eoferror_exits_cleanly(runner, monkeypatch):
     """EOFError inside run_onboard prints 'cancelled' and exits with code 1."""
 
     def raise_eof(_console):
         raise EOFError
 
     monkeypatch.setattr("canvasctl.onboard.run_onboard", raise_eof)
-    result = CliRunner().invoke(app, ["onboard"])
+    result = runner.invoke(app, ["onboard"])
     assert result.exit_code == 1
     assert "cancelled" in result.output.lower()
 
 
-def test_step_token_401_all_retries_exhausted(monkeypatch):
+def test_step_token_401_all_retries_exhausted(runner, monkeypatch):
     """3 consecutive 401s exhaust all retries and return None."""
     monkeypatch.delenv("CANVAS_TOKEN", raising=False)
 
@@ -578,7 +577,7 @@ def test_step_token_401_all_retries_exhausted(monkeypatch):
     assert "too many failed attempts" in _console_out(console).lower()
 
 
-def test_step_token_canvas_api_error_retry_succeeds(monkeypatch):
+def test_step_token_canvas_api_error_retry_succeeds(runner, monkeypatch):
     """First CanvasClient raises CanvasApiError; retry with new token succeeds."""
     monkeypatch.delenv("CANVAS_TOKEN", raising=False)
 
@@ -603,7 +602,7 @@ def test_step_token_canvas_api_error_retry_succeeds(monkeypatch):
     assert client is not None
 
 
-def test_step_token_canvas_api_error_no_retry(monkeypatch):
+def test_step_token_canvas_api_error_no_retry(runner, monkeypatch):
     """CanvasApiError on first attempt, user declines retry: returns None."""
     monkeypatch.delenv("CANVAS_TOKEN", raising=False)
     fake = FakeClient(raise_on_first_call=CanvasApiError("timeout"))
@@ -615,7 +614,7 @@ def test_step_token_canvas_api_error_no_retry(monkeypatch):
     assert client is None
 
 
-def test_step_show_courses_api_error_returns_empty(monkeypatch):
+def test_step_show_courses_api_error_returns_empty(runner, monkeypatch):
     """API error in _step_show_courses returns [] and prints error message."""
     console = _console()
     result = OnboardResult()
@@ -628,7 +627,7 @@ def test_step_show_courses_api_error_returns_empty(monkeypatch):
     assert "could not fetch" in _console_out(console).lower()
 
 
-def test_run_onboard_corrupt_config_falls_back_to_defaults(monkeypatch):
+def test_run_onboard_corrupt_config_falls_back_to_defaults(runner, monkeypatch):
     """Corrupt config (ConfigError from load_config) is caught; onboard continues with defaults."""
     from canvasctl.config import ConfigError
 
@@ -644,7 +643,7 @@ def test_run_onboard_corrupt_config_falls_back_to_defaults(monkeypatch):
     assert "starting with defaults" in _console_out(console).lower()
 
 
-def test_step_token_empty_retry_token_returns_none(monkeypatch):
+def test_step_token_empty_retry_token_returns_none(runner, monkeypatch):
     """Token fails 401 once; user says retry=True but enters blank password → returns None."""
     monkeypatch.delenv("CANVAS_TOKEN", raising=False)
     fake = FakeClient(raise_on_first_call=CanvasUnauthorizedError("bad"))
@@ -2,20 +2,35 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from canvasctl import config
 
 
+@pytest.fixture(scope="module")
+def _config_root(tmp_path_factory):
+    # One temp root for the whole module; per-test subdirs below it skip
+    # pytest's per-test tmp_path create/cleanup churn.
+    return tmp_path_factory.mktemp("config-dirs")
+
+
+@pytest.fixture
+def config_dir(_config_root, request, monkeypatch):
+    d = _config_root / request.node.name
+    d.mkdir()
+    monkeypatch.setattr(config, "config_dir", lambda: d)
+    return d
+
+
 def test_validate_base_url_normalizes_api_suffix():
     value = config.validate_base_url("https://example.instructure.com/api/v1")
     assert value == "https://example.instructure.com"
 
 
-def test_load_save_round_trip(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
-
+def test_load_save_round_trip(config_dir):
     cfg = config.AppConfig(
         base_url="https://school.example.edu",
-        default_dest=str(tmp_path / "downloads"),
+        default_dest=str(config_dir / "downloads"),
         default_concurrency=8,
     )
     config.save_config(cfg)
@@ -23,7 +38,7 @@ def test_load_save_round_trip(tmp_path, monkeypatch):
     loaded = config.load_config()
     assert loaded.base_url == "https://school.example.edu"
     assert loaded.default_concurrency == 8
-    assert loaded.default_dest == str(tmp_path / "downloads")
+    assert loaded.default_dest == str(config_dir / "downloads")
 
 
 def test_destination_path_defaults_to_home_downloads():
@@ -31,9 +46,7 @@ def test_destination_path_defaults_to_home_downloads():
     assert cfg.destination_path() == Path.home() / "Downloads"
 
 
-def test_set_default_destination_persists_resolved_path(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
-
+def test_set_default_destination_persists_resolved_path(config_dir):
     cfg = config.set_default_destination(Path("~/canvasctl-downloads"))
 
     assert cfg.default_dest is not None
@@ -42,9 +55,8 @@ def test_set_default_destination_persists_resolved_path(tmp_path, monkeypatch):
     assert str(Path(loaded.default_dest)).startswith(str(Path.home()))
 
 
-def test_clear_default_destination(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
-    config.set_default_destination(tmp_path / "saved-dest")
+def test_clear_default_destination(config_dir):
+    config.set_default_destination(config_dir / "saved-dest")
 
     cfg = config.clear_default_destination()
 
@@ -53,8 +65,7 @@ def test_clear_default_destination(tmp_path, monkeypatch):
     assert loaded.default_dest is None
 
 
-def test_resolve_base_url_requires_value(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
+def test_resolve_base_url_requires_value(config_dir):
     cfg = config.load_config()
 
     try:
@@ -65,9 +76,7 @@ def test_resolve_base_url_requires_value(tmp_path, monkeypatch):
         raise AssertionError("Expected ConfigError for missing base URL")
 
 
-def test_save_config_omits_none_values(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
-
+def test_save_config_omits_none_values(config_dir):
     cfg = config.AppConfig(
         base_url="https://usfca.instructure.com",
         default_dest=None,
@@ -79,41 +88,37 @@ def test_save_config_omits_none_values(tmp_path, monkeypatch):
     assert "default_dest" not in text
 
 
-def test_course_paths_round_trip(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
-
+def test_course_paths_round_trip(config_dir):
     cfg = config.AppConfig(
         base_url="https://school.example.edu",
         default_concurrency=12,
-        course_paths={"1631791": str(tmp_path / "MSDS-697"), "2000000": str(tmp_path / "MSDS-610")},
+        course_paths={"1631791": str(config_dir / "MSDS-697"), "2000000": str(config_dir / "MSDS-610")},
     )
     config.save_config(cfg)
 
     loaded = config.load_config()
     assert loaded.course_paths is not None
-    assert loaded.course_paths["1631791"] == str(tmp_path / "MSDS-697")
-    assert loaded.course_paths["2000000"] == str(tmp_path / "MSDS-610")
+    assert loaded.course_paths["1631791"] == str(config_dir / "MSDS-697")
+    assert loaded.course_paths["2000000"] == str(config_dir / "MSDS-610")
 
 
-def test_set_course_path_persists(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
+def test_set_course_path_persists(config_dir):
     config.save_config(config.AppConfig())
 
-    cfg = config.set_course_path(1631791, tmp_path / "my-class")
+    cfg = config.set_course_path(1631791, config_dir / "my-class")
 
     assert cfg.course_paths is not None
-    assert cfg.course_paths["1631791"] == str((tmp_path / "my-class").resolve())
+    assert cfg.course_paths["1631791"] == str((config_dir / "my-class").resolve())
 
     loaded = config.load_config()
     assert loaded.course_paths is not None
-    assert loaded.course_paths["1631791"] == str((tmp_path / "my-class").resolve())
+    assert loaded.course_paths["1631791"] == str((config_dir / "my-class").resolve())
 
 
-def test_clear_course_path_removes_mapping(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
+def test_clear_course_path_removes_mapping(config_dir):
     config.save_config(config.AppConfig())
 
-    config.set_course_path(1631791, tmp_path / "my-class")
+    config.set_course_path(1631791, config_dir / "my-class")
     cfg = config.clear_course_path(1631791)
 
     assert cfg.course_paths is None
@@ -131,9 +136,7 @@ def test_get_course_path_returns_none_for_unmapped():
     assert config.get_course_path(1631791, empty_cfg) is None
 
 
-def test_save_config_omits_empty_course_paths(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
-
+def test_save_config_omits_empty_course_paths(config_dir):
     cfg = config.AppConfig(
         base_url="https://usfca.instructure.com",
         default_concurrency=12,
@@ -145,10 +148,7 @@ def test_save_config_omits_empty_course_paths(tmp_path, monkeypatch):
     assert "course_paths" not in text
 
 
-def test_load_config_rejects_empty_default_dest(tmp_path, monkeypatch):
-    monkeypatch.setattr(config, "config_dir", lambda: Path(tmp_path))
-
-    config.config_dir().mkdir(parents=True, exist_ok=True)
+def test_load_config_rejects_empty_default_dest(config_dir):
     config.config_path().write_text(
         'default_concurrency = 12\ndefault_dest = ""\n',
         encoding="utf-8",
@@ -160,3 +160,25 @@ def test_load_config_rejects_empty_default_dest(tmp_path, monkeypatch):
         assert "default_dest" in str(exc)
     else:
         raise AssertionError("Expected ConfigError for empty default_dest")
+
+
+def test_load_config_caches_parse_until_file_changes(config_dir, monkeypatch):
+    config.save_config(config.AppConfig(base_url="https://school.example.edu"))
+
+    calls = {"count": 0}
+    real_load = config.tomllib.load
+
+    def counting_load(fp):
+        calls["count"] += 1
+        return real_load(fp)
+
+    monkeypatch.setattr(config.tomllib, "load", counting_load)
+
+    first = config.load_config()
+    second = config.load_config()
+    assert calls["count"] == 1
+    assert first.base_url == second.base_url == "https://school.example.edu"
+
+    config.save_config(config.AppConfig(base_url="https://other.example.edu"))
+    assert config.load_config().base_url == "https://other.example.edu"
+    assert calls["count"] == 2
@@ -57,6 +57,19 @@ def test_plan_course_download_tasks_resolves_collision(tmp_path):
     assert paths[1] == "intro_12.pdf"
 
 
+def test_plan_course_download_tasks_resolves_case_insensitive_collision(tmp_path):
+    # "Intro.pdf" and "intro.pdf" are the same file on APFS/NTFS; the second
+    # must get an id suffix instead of overwriting the first.
+    course = _course()
+    files = [_file(11, "Intro.pdf"), _file(12, "intro.pdf")]
+
+    tasks = plan_course_download_tasks(course, files, dest_root=tmp_path)
+
+    paths = [task.local_path.name for task in tasks]
+    assert paths[0] == "Intro.pdf"
+    assert paths[1] == "intro_12.pdf"
+
+
 def test_plan_course_download_tasks_with_course_dest(tmp_path):
     course = _course()
     files = [_file(11, "intro.pdf")]
@@ -90,7 +103,7 @@ def test_repeated_downloads_are_idempotent(tmp_path):
         previous_items_by_file_id=None,
         force=False,
         concurrency=4,
-        console=Console(record=True),
+        console=None,
     )
 
     assert all(r.status == "downloaded" for r in results_run1)
@@ -109,7 +122,7 @@ def test_repeated_downloads_are_idempotent(tmp_path):
         previous_items_by_file_id=previous_by_file_id,
         force=False,
         concurrency=4,
-        console=Console(record=True),
+        console=None,
     )
 
     assert all(r.status == "skipped" for r in results_run2)
@@ -141,7 +154,7 @@ def test_repeated_downloads_are_idempotent(tmp_path):
         previous_items_by_file_id=previous_by_file_id_run2,
         force=False,
         concurrency=4,
-        console=Console(record=True),
+        console=None,
     )
 
     # Run 3 should still skip everything (idempotent)
@@ -149,6 +162,29 @@ def test_repeated_downloads_are_idempotent(tmp_path):
     assert client3.downloaded == []
 
 
+def test_download_tasks_renders_progress_with_console(tmp_path):
+    # Keep the Rich progress path covered now that the default is no console.
+    from io import StringIO
+
+    course = _course()
+    files = [_file(11, "intro.pdf")]
+    tasks = plan_course_download_tasks(course, files, dest_root=tmp_path)
+
+    output = StringIO()
+    client = FakeDownloadClient()
+    results = download_tasks(
+        client,
+        tasks,
+        previous_items_by_file_id=None,
+        force=False,
+        concurrency=4,
+        console=Console(file=output, width=80, force_terminal=False),
+    )
+
+    assert [r.status for r in results] == ["downloaded"]
+    assert "Downloading files" in output.getvalue()
+
+
 def test_skipped_without_previous_entry_uses_result(tmp_path):
     """When a file is skipped but has no previous manifest entry, use result_to_manifest_item."""
     from canvasctl.downloader import result_to_manifest_item
@@ -200,8 +236,245 @@ def test_download_tasks_skips_unchanged(tmp_path):
         previous_items_by_file_id=previous_items,
         force=False,
         concurrency=4,
-        console=Console(record=True),
+        console=None,
     )
 
     assert results[0].status == "skipped"
     assert client.downloaded == []
+
+
+def test_download_tasks_skips_unchanged_without_sha256(tmp_path):
+    # The skip check is metadata-only ((size, updated_at) plus a directory
+    # listing); manifests written with compute_hash=False must still skip.
+    course = _course()
+    file_obj = _file(11, "intro.pdf")
+    task = plan_course_download_tasks(course, [file_obj], dest_root=tmp_path)[0]
+
+    task.local_path.parent.mkdir(parents=True, exist_ok=True)
+    task.local_path.write_bytes(b"abc")
+
+    previous_items = {
+        11: {
+            "status": "downloaded",
+            "size": 3,
+            "updated_at": "2025-01-01T00:00:00Z",
+            "sha256": None,
+            "etag": None,
+        }
+    }
+
+    client = FakeDownloadClient()
+    results = download_tasks(
+        client,
+        [task],
+        previous_items_by_file_id=previous_items,
+        force=False,
+        concurrency=4,
+        console=None,
+    )
+
+    assert results[0].status == "skipped"
+    assert results[0].sha256 is None
+    assert client.downloaded == []
+
+
+class FakeConditionalClient:
+    def __init__(self):
+        self.downloaded: list[str] = []
+        self.conditional_etags: list[str | None] = []
+
+    def download_file(self, url: str, destination: Path, *, if_none_match: str | None = None):
+        self.conditional_etags.append(if_none_match)
+        if if_none_match == '"abc"':
+            return None  # 304 Not Modified
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(b"abc")
+        self.downloaded.append(url)
+        return 3, "sha256", "etag"
+
+
+def test_download_tasks_uses_conditional_get(tmp_path):
+    # Local bytes exist and the manifest has an ETag, but updated_at moved:
+    # the downloader should ask with If-None-Match and honor the 304 instead
+    # of re-streaming the file.
+    course = _course()
+    file_obj = _file(11, "intro.pdf")
+    task = plan_course_download_tasks(course, [file_obj], dest_root=tmp_path)[0]
+
+    task.local_path.parent.mkdir(parents=True, exist_ok=True)
+    task.local_path.write_bytes(b"abc")
+
+    previous_items = {
+        11: {
+            "status": "downloaded",
+            "size": 3,
+            "updated_at": "2024-12-31T00:00:00Z",
+            "sha256": "sha256",
+            "etag": '"abc"',
+        }
+    }
+
+    client = FakeConditionalClient()
+    results = download_tasks(
+        client,
+        [task],
+        previous_items_by_file_id=previous_items,
+        force=False,
+        concurrency=4,
+        console=None,
+    )
+
+    assert client.conditional_etags == ['"abc"']
+    assert client.downloaded == []
+    assert results[0].status == "skipped"
+    assert results[0].etag == '"abc"'
+
+
+def test_download_tasks_normalizes_weak_etags(tmp_path):
+    # A weak validator recorded from one CDN edge (W/"abc") must revalidate
+    # against an edge that serves the strong form.
+    course = _course()
+    file_obj = _file(11, "intro.pdf")
+    task = plan_course_download_tasks(course, [file_obj], dest_root=tmp_path)[0]
+
+    task.local_path.parent.mkdir(parents=True, exist_ok=True)
+    task.local_path.write_bytes(b"abc")
+
+    previous_items = {
+        11: {
+            "status": "downloaded",
+            "size": 3,
+            "updated_at": "2024-12-31T00:00:00Z",
+            "sha256": "sha256",
+            "etag": 'W/"abc"',
+        }
+    }
+
+    client = FakeConditionalClient()
+    results = download_tasks(
+        client,
+        [task],
+        previous_items_by_file_id=previous_items,
+        force=False,
+        concurrency=4,
+        console=None,
+    )
+
+    assert client.conditional_etags == ['"abc"']
+    assert client.downloaded == []
+    assert results[0].status == "skipped"
+
+
+def test_download_tasks_redownloads_on_etag_mismatch(tmp_path):
+    # A different validator means the entity changed: full re-download.
+    course = _course()
+    file_obj = _file(11, "intro.pdf")
+    task = plan_course_download_tasks(course, [file_obj], dest_root=tmp_path)[0]
+
+    task.local_path.parent.mkdir(parents=True, exist_ok=True)
+    task.local_path.write_bytes(b"old")
+
+    previous_items = {
+        11: {
+            "status": "downloaded",
+            "size": 3,
+            "updated_at": "2024-12-31T00:00:00Z",
+            "sha256": "sha256",
+            "etag": 'W/"stale"',
+        }
+    }
+
+    client = FakeConditionalClient()
+    results = download_tasks(
+        client,
+        [task],
+        previous_items_by_file_id=previous_items,
+        force=False,
+        concurrency=4,
+        console=None,
+    )
+
+    assert client.conditional_etags == ['"stale"']
+    assert client.downloaded == [file_obj.download_url]
+    assert results[0].status == "downloaded"
+
+
+def test_download_tasks_redownloads_when_local_file_missing(tmp_path):
+    # No local bytes to reuse: a 304 would leave us with nothing, so the
+    # downloader must issue an unconditional GET.
+    course = _course()
+    file_obj = _file(11, "intro.pdf")
+    task = plan_course_download_tasks(course, [file_obj], dest_root=tmp_path)[0]
+
+    previous_items = {
+        11: {
+            "status": "downloaded",
+            "size": 3,
+            "updated_at": "2025-01-01T00:00:00Z",
+            "sha256": "sha256",
+            "etag": "etag",
+        }
+    }
+
+    client = FakeConditionalClient()
+    results = download_tasks(
+        client,
+        [task],
+        previous_items_by_file_id=previous_items,
+        force=False,
+        concurrency=4,
+        console=None,
+    )
+
+    assert client.conditional_etags == [None]
+    assert client.downloaded == [file_obj.download_url]
+    assert results[0].status == "downloaded"
+
+
+class FakeAsyncDownloadClient:
+    def __init__(self):
+        self.downloaded: list[str] = []
+
+    async def download_file(self, url: str, destination: Path, *, compute_hash: bool = True):
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(b"abc")
+        self.downloaded.append(url)
+        return 3, "sha256", "etag"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+def test_download_tasks_uses_async_clone_when_available(tmp_path):
+    course = _course()
+    files = [_file(11, "intro.pdf"), _file(12, "notes.pdf")]
+    tasks = plan_course_download_tasks(course, files, dest_root=tmp_path)
+
+    async_client = FakeAsyncDownloadClient()
+
+    class CloneableClient:
+        def async_clone(self):
+            return async_client
+
+        def download_file(self, url: str, destination: Path):
+            raise AssertionError("sync download_file should not be used")
+
+    results = download_tasks(
+        CloneableClient(),
+        tasks,
+        previous_items_by_file_id=None,
+        force=False,
+        concurrency=4,
+        console=None,
+    )
+
+    assert sorted(r.status for r in results) == ["downloaded", "downloaded"]
+    assert sorted(async_client.downloaded) == [
+        "https://example/11",
+        "https://example/12",
+    ]
+    for task in tasks:
+        assert task.local_path.read_bytes() == b"abc"
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import csv
 import json
+from io import StringIO
+
+import pytest
+from rich.console import Console
 
 from canvasctl.canvas_api import AssignmentGrade, CourseGrade
 from canvasctl.grades import (
@@ -9,13 +13,29 @@ from canvasctl.grades import (
     export_grades_csv,
     export_grades_json,
     grade_to_dict,
+    render_detailed_grades_plain,
     render_detailed_grades_table,
+    render_grades_summary_plain,
     render_grades_summary_table,
     sort_assignment_grades,
     sort_grades,
 )
 
 
+@pytest.fixture(scope="module")
+def render_console() -> Console:
+    # One Console for the module: construction walks env vars and detects a
+    # color system every time, which the render tests do not care about.
+    return Console(file=StringIO(), width=120, force_terminal=False, color_system=None)
+
+
+def _render(console: Console, table) -> str:
+    console.file.seek(0)
+    console.file.truncate()
+    console.print(table)
+    return console.file.getvalue()
+
+
 def _make_course_grade(**overrides) -> CourseGrade:
     defaults = {
         "course_id": 1,
@@ -53,6 +73,28 @@ def test_sort_grades_by_code_name_id():
     assert [g.course_id for g in sorted_grades] == [2, 1, 3]
 
 
+def test_sort_grades_tolerates_missing_code():
+    grades = [
+        _make_course_grade(course_id=2, course_code="MATH201"),
+        _make_course_grade(course_id=1, course_code=None, course_name=None),
+    ]
+    sorted_grades = sort_grades(grades)
+    assert [g.course_id for g in sorted_grades] == [1, 2]
+
+
+def test_render_plain_tolerates_missing_names():
+    # sort_grades tolerates None codes, so the plain renderers must too
+    # instead of raising TypeError from "\t".join.
+    grade = _make_course_grade(course_id=1, course_code=None, course_name=None)
+    ag = _make_assignment_grade(assignment_name=None)
+
+    summary = render_grades_summary_plain([grade])
+    detailed = render_detailed_grades_plain(grade, [ag])
+
+    assert summary.splitlines()[1] == "1\t\t\tA-\t92.5"
+    assert detailed.splitlines()[2].startswith("\t95.0")
+
+
 def test_grade_to_dict():
     grade = _make_course_grade()
     result = grade_to_dict(grade)
@@ -94,40 +136,25 @@ def test_render_grades_summary_table_has_columns():
     assert "Score (%)" in column_names
 
 
-def test_render_grades_summary_table_na_for_none():
+def test_render_grades_summary_table_na_for_none(render_console):
     grade = _make_course_grade(current_score=None, current_grade=None)
     table = render_grades_summary_table([grade])
-    # Render the table to check N/A appears
-    from io import StringIO
-
-    from rich.console import Console
-
-    output = StringIO()
-    console = Console(file=output, width=120)
-    console.print(table)
-    rendered = output.getvalue()
+    rendered = _render(render_console, table)
     assert "N/A" in rendered
 
 
-def test_render_detailed_grades_table_includes_overall():
+def test_render_detailed_grades_table_includes_overall(render_console):
     course_grade = _make_course_grade()
     assignments = [_make_assignment_grade()]
     table = render_detailed_grades_table(course_grade, assignments)
 
-    from io import StringIO
-
-    from rich.console import Console
-
-    output = StringIO()
-    console = Console(file=output, width=120)
-    console.print(table)
-    rendered = output.getvalue()
+    rendered = _render(render_console, table)
     assert "OVERALL" in rendered
     assert "92.5%" in rendered
     assert "A-" in rendered
 
 
-def test_render_detailed_grades_table_shows_assignments():
+def test_render_detailed_grades_table_shows_assignments(render_console):
     course_grade = _make_course_grade()
     assignments = [
         _make_assignment_grade(assignment_name="Midterm Exam"),
@@ -135,14 +162,7 @@ def test_render_detailed_grades_table_shows_assignments():
     ]
     table = render_detailed_grades_table(course_grade, assignments)
 
-    from io import StringIO
-
-    from rich.console import Console
-
-    output = StringIO()
-    console = Console(file=output, width=120)
-    console.print(table)
-    rendered = output.getvalue()
+    rendered = _render(render_console, table)
     assert "Midterm Exam" in rendered
     assert "Final Paper" in rendered
 
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from canvasctl.manifest import index_items_by_file_id, load_manifest, write_manifest
+import sys
+import threading
+
+from canvasctl.manifest import (
+    clear_manifest_cache,
+    index_items_by_file_id,
+    load_manifest,
+    write_manifest,
+)
 
 
 def test_write_and_load_manifest(tmp_path):
@@ -13,6 +21,19 @@ def test_write_and_load_manifest(tmp_path):
     assert loaded == payload
 
 
+def test_load_manifest_caches_until_file_changes(tmp_path):
+    clear_manifest_cache()
+    path = tmp_path / "manifest.json"
+    write_manifest(path, {"items": [{"file_id": 1, "status": "downloaded"}]})
+
+    first = load_manifest(path)
+    second = load_manifest(path)
+    assert second is first
+
+    write_manifest(path, {"items": []})
+    assert load_manifest(path) == {"items": []}
+
+
 def test_index_items_by_file_id():
     payload = {
         "items": [
@@ -25,3 +46,73 @@ def test_index_items_by_file_id():
     indexed = index_items_by_file_id(payload)
 
     assert set(indexed.keys()) == {1, 2}
+
+
+def test_index_memoized_for_loaded_manifest(tmp_path):
+    clear_manifest_cache()
+    path = tmp_path / "manifest.json"
+    write_manifest(path, {"items": [{"file_id": 1, "status": "downloaded"}]})
+
+    payload = load_manifest(path)
+    first = index_items_by_file_id(payload)
+    second = index_items_by_file_id(payload)
+
+    assert second is first
+
+
+def test_concurrent_load_and_index_is_thread_safe(tmp_path):
+    # The CLI preloads manifests from a thread pool, so load_manifest can
+    # insert into the cache while index_items_by_file_id walks it. Without
+    # locking this intermittently raised "dictionary changed size during
+    # iteration"; hammer the pair from several threads to keep it fixed.
+    clear_manifest_cache()
+    paths = []
+    for number in range(16):
+        path = tmp_path / f"manifest-{number}.json"
+        write_manifest(path, {"items": [{"file_id": number, "status": "downloaded"}]})
+        paths.append(path)
+
+    errors: list[Exception] = []
+
+    def worker(offset: int) -> None:
+        try:
+            for index in range(200):
+                # Each worker rewrites only its own manifest (concurrent
+                # writers to one path are not a supported pattern), which
+                # evicts and re-inserts so the cache keeps changing size
+                # while other threads walk it.
+                own_path = paths[offset]
+                write_manifest(own_path, {"items": [{"file_id": index, "status": "downloaded"}]})
+                payload = load_manifest(paths[(offset + index) % len(paths)])
+                index_items_by_file_id(payload)
+        except Exception as exc:  # pragma: no cover - only on regression
+            errors.append(exc)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(number,)) for number in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+
+
+def test_rewrite_releases_old_payload_and_index(tmp_path):
+    # A long-lived process cycles load → write per sync run; the cache must
+    # not accumulate one stale payload/index pair per rewrite.
+    clear_manifest_cache()
+    path = tmp_path / "manifest.json"
+    write_manifest(path, {"items": [{"file_id": 1, "status": "downloaded"}]})
+
+    old_payload = load_manifest(path)
+    index_items_by_file_id(old_payload)
+    write_manifest(path, {"items": []})
+
+    from canvasctl.manifest import _MANIFEST_CACHE
+
+    assert all(entry[2] is not old_payload for entry in _MANIFEST_CACHE.values())
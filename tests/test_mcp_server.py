@@ -6,6 +6,7 @@ CanvasClient inside the context so no real HTTP calls are made.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -17,6 +18,7 @@ from canvasctl.canvas_api import (
     CalendarEvent,
     CourseGrade,
     CourseSummary,
+    RemoteFile,
     UpcomingAssignment,
 )
 from canvasctl.config import AppConfig
@@ -570,6 +572,44 @@ class TestSyncCourseFiles:
         assert result["total_files"] == 1
         assert "destination" in result
 
+    def test_sync_downloads_inside_running_event_loop(self, tmp_path):
+        # FastMCP invokes sync tools inline on its event loop, so
+        # download_tasks (unpatched here) must not call asyncio.run().
+        client = MagicMock()  # MagicMock exposes async_clone, like the real client
+        client.list_courses.return_value = [_BIO_COURSE]
+
+        def fake_download(url, destination, **_kwargs):
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.write_bytes(b"abc")
+            return 3, "sha256", '"abc"'
+
+        client.download_file.side_effect = fake_download
+        cfg = AppConfig(default_dest=str(tmp_path))
+        ctx = _make_ctx(client, config=cfg)
+
+        remote = RemoteFile(
+            file_id=1,
+            course_id=100,
+            display_name="notes.pdf",
+            filename="notes.pdf",
+            folder_path="",
+            size=3,
+            updated_at=None,
+            download_url="https://canvas.test/files/1/download",
+            source_type="files",
+            source_ref="files:1",
+        )
+
+        async def invoke() -> str:
+            return sync_course_files(ctx, course_id=100)
+
+        with patch(f"{_SYNC_PREFIX}.collect_remote_files_for_course", return_value=([remote], [])):
+            result = json.loads(asyncio.run(invoke()))
+
+        assert "error" not in result
+        assert result["downloaded"] == 1
+        assert (tmp_path / "bio101-100" / "notes.pdf").read_bytes() == b"abc"
+
     def test_course_not_found(self):
         client = MagicMock()
         client.list_courses.return_value = []
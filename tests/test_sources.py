@@ -65,12 +65,30 @@ def test_extract_file_ids_from_text():
     assert extract_file_ids_from_text(text) == {123, 456}
 
 
+def test_extract_file_ids_from_text_large_document():
+    # A realistic worst case: thousands of hrefs in one aggregated HTML blob.
+    text = "".join(
+        f'<a href="https://school.test/courses/1/files/{i}/download">f{i}</a>\n'
+        for i in range(10_000)
+    )
+    assert extract_file_ids_from_text(text) == set(range(10_000))
+
+
 def test_extract_file_ids_from_payload_with_attachments():
     payload = {
         "attachments": [{"id": 9}, {"id": "10"}],
         "description": "See /files/20/download",
     }
-    assert extract_file_ids_from_payload(payload) == {9, 10, 20}
+    file_ids, saw_unresolved = extract_file_ids_from_payload(payload)
+    assert file_ids == {9, 10, 20}
+    assert saw_unresolved is False
+
+
+def test_extract_file_ids_from_payload_flags_unresolved_links():
+    payload = {"description": "See /files/ for the handout"}
+    file_ids, saw_unresolved = extract_file_ids_from_payload(payload)
+    assert file_ids == set()
+    assert saw_unresolved is True
 
 
 def test_collect_remote_files_combines_sources():
@@ -88,6 +106,60 @@ def test_collect_remote_files_combines_sources():
     assert warnings == []
 
 
+class SharedAttachmentClient(FakeCanvasClient):
+    def list_discussions(self, course_id: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": 200,
+                "message": '<a href="https://school/files/22/download">same file</a>',
+            }
+        ]
+
+
+def test_collect_remote_files_resolves_shared_attachment_once():
+    # The same attachment referenced from several sources must cost one
+    # get_file round-trip, and a file already in the files listing none.
+    client = SharedAttachmentClient()
+
+    files, warnings = collect_remote_files_for_course(
+        client,
+        course_id=1,
+        sources=["files", "assignments", "discussions"],
+    )
+
+    ids = {item.file_id for item in files}
+    assert ids == {11, 22}
+    assert client.file_lookup_called == [22]
+    assert warnings == []
+
+
+class ListedOnlyClient(FakeCanvasClient):
+    def list_assignments(self, course_id: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": 100,
+                "description": '<a href="https://school/files/11/download">listed file</a>',
+            }
+        ]
+
+
+def test_collect_remote_files_short_circuits_when_files_complete():
+    # HTML that only references files already in the course listing must not
+    # trigger any get_file round-trips.
+    client = ListedOnlyClient()
+
+    files, warnings = collect_remote_files_for_course(
+        client,
+        course_id=1,
+        sources=["files", "assignments"],
+    )
+
+    ids = {item.file_id for item in files}
+    assert ids == {11}
+    assert client.file_lookup_called == []
+    assert warnings == []
+
+
 class RestrictedCanvasClient(FakeCanvasClient):
     def list_course_files(self, course_id: int) -> list[dict[str, Any]]:
         raise CanvasApiError("Canvas request failed (403) for courses/1/files")